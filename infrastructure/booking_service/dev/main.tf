@@ -41,6 +41,7 @@ module "booking_service" {
   retained_image_count            = 3
   untagged_image_expiry_days      = 7
   log_retention_in_days           = 30
+  # More than one container disables the per-process booking list cache, see the module's variables.tf
   container_count                 = 1
   engine                          = "postgres"
   engine_version                  = "16.3"
@@ -27,14 +27,18 @@ resource "aws_ecs_task_definition" "booking_service" {
           "0.0.0.0:${var.container_port}",
           "app.main:app",
           "-k",
-          "uvicorn.workers.UvicornWorker"
+          "uvicorn.workers.UvicornWorker",
+          "--workers",
+          "1"
         ],
         essential = true,
         # Environment variables to be passed to the container (i.e., maps to ENV in Dockerfiles)
         environment = [
           { name = "ENV", value = var.environment },
           { name = "AWS_DEFAULT_REGION", value = var.region },
-          { name = "DOCS_URL", value = var.docs_url }
+          { name = "DOCS_URL", value = var.docs_url },
+          # The booking list is cached per process, so the cache is only enabled for a single container
+          { name = "BOOKING_LIST_CACHE_ENABLED", value = tostring(var.container_count == 1) }
         ],
         portMappings = [
           {
@@ -66,6 +66,13 @@ resource "aws_iam_role_policy" "ecs_task_role_policy" {
             aws_secretsmanager_secret.requester_password.arn,
             aws_secretsmanager_secret.db_connection_string.arn
           ]
+        },
+        {
+          # BatchGetSecretValue does not support resource-level permissions, see https://docs.aws.amazon.com/secretsmanager/latest/apireference/API_BatchGetSecretValue.html
+          # Access to each individual secret is still governed by the GetSecretValue statement above
+          Effect   = "Allow",
+          Action   = ["secretsmanager:BatchGetSecretValue"],
+          Resource = "*"
         }
       ]
     }
@@ -72,6 +72,8 @@ variable "ecs_security_group_id" {
 
 variable "container_count" {
   type        = number
+  # The booking list is cached in each process and only invalidated by writes served by that process, so the
+  # cache is disabled when more than one container runs; deploy_ecs.py reads this count from the service
   description = "Number of containers to run in the ECS task"
 }
 
@@ -1,48 +1,77 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, Path
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth import (
-    get_current_active_user,
-    get_current_admin,
-    get_current_user_or_admin,
-)
+from app.api.routing import ORJSONRoute
+from app.auth import get_current_admin, get_current_user_or_admin
+from app.config import get_settings
 from app.db import get_database_session
-from app.models import *
+from app.models import (
+    AcceptRequest,
+    BookingResponse,
+    BookingResponseList,
+    RejectRequest,
+    RequestStatus,
+    SubmissionRequest,
+)
 from app.models.db_models import DatabaseOperations
 
-router = APIRouter()
+# JSON request bodies are parsed with orjson; responses use the application's default ORJSONResponse
+router = APIRouter(route_class=ORJSONRoute)
+
+# The booking list served by 'GET /booking/' is cached per process for a short time, and every endpoint that
+# writes a booking invalidates it after its transaction commits, so a worker never serves a list that misses its
+# own writes; each invalidation bumps the generation, and a list read only caches its result if the generation
+# is unchanged, so a read that started before a concurrent write committed never re-caches the stale list; writes
+# served by other processes are not seen, so the cache is only enabled when the service runs a single process
+BOOKING_LIST_CACHE_ENABLED = get_settings().booking_list_cache_enabled
+BOOKING_LIST_CACHE_KEY = "bookings"
+BOOKING_LIST_CACHE_TTL_SECONDS = 30
+booking_list_cache: TTLCache = TTLCache(maxsize=1, ttl=BOOKING_LIST_CACHE_TTL_SECONDS)
+booking_list_cache_generation = 0
+
+
+def invalidate_booking_list_cache() -> None:
+    """
+    Clear the cached booking list and bump its generation, so that list reads still in flight do not cache
+    their possibly stale results.
+    """
+    global booking_list_cache_generation
+    booking_list_cache_generation += 1
+    booking_list_cache.clear()
 
 
 @router.post(
     "/",
     status_code=201,
     response_model=BookingResponse,
-    dependencies=[Depends(get_current_user_or_admin), Depends(get_current_active_user)],
+    dependencies=[Depends(get_current_user_or_admin)],
 )
 async def submit_request(
-    submission: SubmissionRequest, database_session: Session = Depends(get_database_session)
+    submission: SubmissionRequest, database_session: AsyncSession = Depends(get_database_session)
 ) -> BookingResponse:
     """
     Submit a new booking request.
 
     This endpoint allows the submission of a new booking request. The booking will be stored
-    in the database and returned with a status of "pending".
+    in the database and returned with a status of "pending" and the ID generated by the database.
 
     Parameters
     ----------
     submission : SubmissionRequest
         The request data containing event details such as event time, address, topic, duration, and the requester.
-    database_session : Session, optional
-        A SQLAlchemy database session for interacting with the database, by default Depends(get_database_session).
+    database_session : AsyncSession, optional
+        A SQLAlchemy async database session for interacting with the database, by default Depends(get_database_session).
 
     Returns
     -------
     BookingResponse
-        The submitted booking request with a status of "pending".
+        The submitted booking request with its ID and a status of "pending".
     """
-    booking_response = BookingResponse(
+    # The submission was validated by FastAPI, so the response is constructed without validating it again
+    booking_response = BookingResponse.model_construct(
         event_time=submission.event_time,
         address=submission.address,
         topic=submission.topic,
@@ -51,7 +80,9 @@ async def submit_request(
         status=RequestStatus.pending,
     )
     db_operations = DatabaseOperations(database_session)
-    db_operations.save_booking(booking_response)
+    async with database_session.begin():
+        booking_response.id = await db_operations.save_booking(booking_response)
+    invalidate_booking_list_cache()
     return booking_response
 
 
@@ -59,42 +90,56 @@ async def submit_request(
     "/",
     status_code=200,
     response_model=BookingResponseList,
-    dependencies=[Depends(get_current_admin), Depends(get_current_active_user)],
+    dependencies=[Depends(get_current_admin)],
 )
 async def list_requests(
-    database_session: Session = Depends(get_database_session),
+    database_session: AsyncSession = Depends(get_database_session),
 ) -> BookingResponseList:
     """
     Retrieve a list of all booking requests.
 
     This endpoint fetches and returns a list of all the booking requests from the database.
-    Each booking is returned with its details, including its current status.
+    Each booking is returned with its details, including its current status. The list is cached
+    for `BOOKING_LIST_CACHE_TTL_SECONDS` and invalidated by the endpoints that modify bookings; a list read
+    while a write was committed is returned but not cached. The list is read from the database on every
+    request unless `BOOKING_LIST_CACHE_ENABLED` is set.
 
     Parameters
     ----------
-    database_session : Session, optional
-        A SQLAlchemy database session for interacting with the database, by default Depends(get_database_session).
+    database_session : AsyncSession, optional
+        A SQLAlchemy async database session for interacting with the database, by default Depends(get_database_session).
 
     Returns
     -------
     BookingResponseList
         A list of all booking requests.
     """
+    if BOOKING_LIST_CACHE_ENABLED:
+        cached_bookings: Optional[BookingResponseList] = booking_list_cache.get(
+            BOOKING_LIST_CACHE_KEY
+        )
+        if cached_bookings is not None:
+            return cached_bookings
+    generation = booking_list_cache_generation
     db_operations = DatabaseOperations(database_session)
-    booking_responses = db_operations.list_bookings()
-    return BookingResponseList(
-        bookings=[booking_response for booking_response in booking_responses]
-    )
+    booking_responses = await db_operations.list_bookings()
+    # The bookings are already validated 'BookingResponse' instances, so skip re-validating them
+    booking_response_list = BookingResponseList.model_construct(bookings=booking_responses)
+    # A write that committed while the bookings were read may be missing from them, so only cache the list if no
+    # write invalidated the cache in the meantime
+    if BOOKING_LIST_CACHE_ENABLED and generation == booking_list_cache_generation:
+        booking_list_cache[BOOKING_LIST_CACHE_KEY] = booking_response_list
+    return booking_response_list
 
 
 @router.post(
     "/accept/",
     status_code=200,
     response_model=BookingResponse,
-    dependencies=[Depends(get_current_admin), Depends(get_current_active_user)],
+    dependencies=[Depends(get_current_admin)],
 )
 async def accept_request(
-    accept_response: AcceptRequest, database_session: Session = Depends(get_database_session)
+    accept_response: AcceptRequest, database_session: AsyncSession = Depends(get_database_session)
 ) -> BookingResponse:
     """
     Accept a booking request.
@@ -106,8 +151,8 @@ async def accept_request(
     ----------
     accept_response : AcceptRequest
         The ID of the booking request to accept.
-    database_session : Session, optional
-        A SQLAlchemy database session for interacting with the database, by default Depends(get_database_session).
+    database_session : AsyncSession, optional
+        A SQLAlchemy async database session for interacting with the database, by default Depends(get_database_session).
 
     Returns
     -------
@@ -115,10 +160,13 @@ async def accept_request(
         The updated booking request with a status of "accepted".
     """
     db_operations = DatabaseOperations(database_session)
-    booking_response = db_operations.list_booking_by_id(accept_response.id)
-    # Accept the booking request
-    booking_response.accept()
-    db_operations.save_booking(booking_response)
+    # Look up and update the booking in one transaction, committed when the block exits
+    async with database_session.begin():
+        booking_response = await db_operations.list_booking_by_id(accept_response.id)
+        # Accept the booking request
+        booking_response.accept()
+        await db_operations.save_booking(booking_response)
+    invalidate_booking_list_cache()
     return booking_response
 
 
@@ -126,10 +174,10 @@ async def accept_request(
     "/reject/",
     status_code=200,
     response_model=BookingResponse,
-    dependencies=[Depends(get_current_admin), Depends(get_current_active_user)],
+    dependencies=[Depends(get_current_admin)],
 )
 async def reject_request(
-    reject_response: RejectRequest, database_session: Session = Depends(get_database_session)
+    reject_response: RejectRequest, database_session: AsyncSession = Depends(get_database_session)
 ) -> BookingResponse:
     """
     Reject a booking request.
@@ -141,8 +189,8 @@ async def reject_request(
     ----------
     reject_response : RejectRequest
         The ID of the booking request to reject.
-    database_session : Session, optional
-        A SQLAlchemy database session for interacting with the database, by default Depends(get_database_session).
+    database_session : AsyncSession, optional
+        A SQLAlchemy async database session for interacting with the database, by default Depends(get_database_session).
 
     Returns
     -------
@@ -150,10 +198,13 @@ async def reject_request(
         The updated booking request with a status of "rejected".
     """
     db_operations = DatabaseOperations(database_session)
-    booking_response = db_operations.list_booking_by_id(reject_response.id)
-    # Reject the booking request
-    booking_response.reject()
-    db_operations.save_booking(booking_response)
+    # Look up and update the booking in one transaction, committed when the block exits
+    async with database_session.begin():
+        booking_response = await db_operations.list_booking_by_id(reject_response.id)
+        # Reject the booking request
+        booking_response.reject()
+        await db_operations.save_booking(booking_response)
+    invalidate_booking_list_cache()
     return booking_response
 
 
@@ -161,11 +212,11 @@ async def reject_request(
     "/{id}/",
     status_code=200,
     response_model=BookingResponse,
-    dependencies=[Depends(get_current_admin), Depends(get_current_active_user)],
+    dependencies=[Depends(get_current_admin)],
 )
 async def delete_request(
     id: Annotated[int, Path(title="The ID of the booking request to delete", gt=0)],
-    database_session: Session = Depends(get_database_session),
+    database_session: AsyncSession = Depends(get_database_session),
 ) -> BookingResponse:
     """
     Delete a booking request.
@@ -177,8 +228,8 @@ async def delete_request(
     ----------
     delete_request : DeleteRequest
         The request object containing the ID of the booking to delete.
-    database_session : Session, optional
-        A SQLAlchemy database session for interacting with the database, by default Depends(get_database_session).
+    database_session : AsyncSession, optional
+        A SQLAlchemy async database session for interacting with the database, by default Depends(get_database_session).
 
     Returns
     -------
@@ -186,5 +237,7 @@ async def delete_request(
         The response object for the deleted booking request.
     """
     db_operations = DatabaseOperations(database_session)
-    booking_response = db_operations.delete_booking_by_id(id)
+    async with database_session.begin():
+        booking_response = await db_operations.delete_booking_by_id(id)
+    invalidate_booking_list_cache()
     return booking_response
@@ -1,18 +1,47 @@
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 from alembic import config, script
 from alembic.runtime import migration
-from fastapi import APIRouter, Response
-from sqlalchemy import create_engine
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import get_settings
+from app.db import get_database_session
 
 router = APIRouter()
 
+# The migration scripts shipped with the image do not change while the application is running, so the
+# Alembic configuration is parsed and the head revision is resolved once at import
+MIGRATIONS_PATH = Path(__file__).parents[2] / "migrations"
+alembic_config = config.Config(str(MIGRATIONS_PATH / "alembic.ini"))
+alembic_config.set_main_option("script_location", str(MIGRATIONS_PATH))
+migration_script = script.ScriptDirectory.from_config(alembic_config)
+HEAD_REVISION = migration_script.get_current_head()
+
+
+def get_current_revision(connection: Connection) -> Optional[str]:
+    """
+    Read the revision stamped in the database's `alembic_version` table.
+
+    Parameters
+    ----------
+    connection : Connection
+        A synchronous connection, as provided by `AsyncConnection.run_sync`.
+
+    Returns
+    -------
+    Optional[str]
+        The current database revision, or None if no migration has been applied.
+    """
+    context = migration.MigrationContext.configure(connection)
+    return context.get_current_revision()
+
 
 @router.get("/ping/", response_model=Dict[str, str])
-async def ping(response: Response) -> Dict[str, str]:
+async def ping(
+    response: Response, database_session: AsyncSession = Depends(get_database_session)
+) -> Dict[str, str]:
     """
     Health check endpoint that verifies the database's migration status.
 
@@ -31,25 +60,18 @@ async def ping(response: Response) -> Dict[str, str]:
     ----------
     response : Response
         The response object.
+    database_session : AsyncSession, optional
+        A SQLAlchemy async database session whose pooled connection is used to read the current revision,
+        by default Depends(get_database_session).
 
     Returns
     -------
     Dict
         A dictionary containing the message "ok".
     """
-    settings = get_settings()
-    database_url = settings.database_url
-    engine = create_engine(database_url)
-
-    # Path relative to the current file
-    alembic_config = config.Config(str(Path(__file__).parents[2] / "migrations" / "alembic.ini"))
-    alembic_config.set_main_option("script_location", str(Path(__file__).parents[2] / "migrations"))
-    migration_script = script.ScriptDirectory.from_config(alembic_config)
-
-    with engine.connect() as conn:
-        context = migration.MigrationContext.configure(conn)
-        # Check if the current revision is the latest
-        if context.get_current_revision() != migration_script.get_current_head():
-            response.status_code = 400
-            return {"message": "Database is not up-to-date yet"}
+    connection = await database_session.connection()
+    # Check if the current revision is the latest
+    if await connection.run_sync(get_current_revision) != HEAD_REVISION:
+        response.status_code = 400
+        return {"message": "Database is not up-to-date yet"}
     return {"message": "ok"}
@@ -0,0 +1,51 @@
+from typing import Any, Callable, Coroutine
+
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRequest(Request):
+    """
+    Request whose JSON body is parsed with orjson instead of the standard library's json module.
+
+    Since `orjson.JSONDecodeError` is a subclass of `json.JSONDecodeError`, malformed bodies are still
+    reported by FastAPI as a 422 validation error.
+    """
+
+    async def json(self) -> Any:
+        """
+        Parse the request body as JSON, caching the result on the request.
+
+        Returns
+        -------
+        Any
+            The deserialized JSON body.
+        """
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """
+    Route class that hands its endpoint an `ORJSONRequest`, so request bodies are parsed with orjson.
+
+    See https://fastapi.tiangolo.com/how-to/custom-request-and-route/ for more information.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """
+        Wrap the default route handler so that it receives an `ORJSONRequest`.
+
+        Returns
+        -------
+        Callable[[Request], Coroutine[Any, Any, Response]]
+            The route handler.
+        """
+        original_route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
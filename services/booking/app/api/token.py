@@ -3,7 +3,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import Token, authenticate_user, create_access_token
 from app.db import get_database_session
@@ -15,7 +15,7 @@ router = APIRouter()
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    database_session: Session = Depends(get_database_session),
+    database_session: AsyncSession = Depends(get_database_session),
 ) -> Token:
     """
     Handles user login and returns a JWT token for valid credentials.
@@ -24,8 +24,8 @@ async def login_for_access_token(
     ----------
     form_data : OAuth2PasswordRequestForm
         The form data submitted for authentication, including username and password.
-    database_session : Session
-        The SQLAlchemy database session for accessing user records.
+    database_session : AsyncSession
+        The SQLAlchemy async database session for accessing user records.
 
     Returns
     -------
@@ -38,7 +38,7 @@ async def login_for_access_token(
         If the authentication fails due to incorrect username or password.
     """
     # Authenticate the user using the database session
-    user = authenticate_user(database_session, form_data.username, form_data.password)
+    user = await authenticate_user(database_session, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
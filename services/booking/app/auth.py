@@ -1,45 +1,103 @@
+import asyncio
+import hashlib
 import os
+import time
 from base64 import b64decode
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Annotated, Dict, Optional, Union
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Collection,
+    Coroutine,
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
-import boto3
 import jwt
+from cachetools import TLRUCache, TTLCache
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 from passlib.context import CryptContext
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.db import get_database_session
+from app.config import get_secrets
+from app.db import get_local_session
 from app.models.db_models import User
 
 ALGORITHM = "EdDSA"
 ENV = os.getenv("ENV")
+PUBLIC_KEY: Union[str, Ed25519PublicKey]
+PRIVATE_KEY: Union[str, Ed25519PrivateKey]
 
 # In test mode, we don't need to fetch the secrets from aws secrets manager since we mock the authentication
 if ENV == "test":
     PUBLIC_KEY, PRIVATE_KEY = "test_public_key", "test_private_key"
-# In dev or prod mode, fetch the secrets from aws secrets manager
+# In dev or prod mode, fetch the secrets from aws secrets manager (shared with the database connection string)
 elif ENV in ["dev", "prod"]:
-    sm = boto3.client("secretsmanager")
-    # Secret and algorithm settings
-    PUBLIC_KEY = b64decode(
-        sm.get_secret_value(SecretId=f"public_key_{ENV}")["SecretString"]
-    ).decode("utf-8")
-    PRIVATE_KEY = b64decode(
-        sm.get_secret_value(SecretId=f"private_key_{ENV}")["SecretString"]
-    ).decode("utf-8")
-    sm.close()
+    secrets = get_secrets(ENV)
+    # Parse the PEM encoded keys once, since PyJWT would otherwise re-parse them on every encode and decode
+    PUBLIC_KEY = cast(
+        Ed25519PublicKey, load_pem_public_key(b64decode(secrets[f"public_key_{ENV}"]))
+    )
+    PRIVATE_KEY = cast(
+        Ed25519PrivateKey,
+        load_pem_private_key(b64decode(secrets[f"private_key_{ENV}"]), password=None),
+    )
 else:
     raise RuntimeError("Unknown environment: Please set 'ENV' to 'test', 'dev', or 'prod'")
 
+# Roles allowed by the authorization dependencies, built once at import
+ADMIN_ROLES = frozenset({"admin"})
+USER_OR_ADMIN_ROLES = frozenset({"requester", "admin"})
+
 # Password hashing context and OAuth2 scheme
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Verified tokens are cached per process, mapping the raw token to the user and the token's 'exp' claim;
+# each entry lives for at most TOKEN_CACHE_TTL_SECONDS and never past the token's own expiry
+TOKEN_CACHE_MAXSIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 60
+token_cache: TLRUCache = TLRUCache(
+    maxsize=TOKEN_CACHE_MAXSIZE,
+    ttu=lambda _token, value, now: min(value[1], now + TOKEN_CACHE_TTL_SECONDS),
+    timer=time.time,
+)
+
+# Failed logins are remembered for a short time, keyed by a digest of the submitted credentials, so that
+# repeated identical attempts are rejected without another database lookup and bcrypt verification
+FAILED_LOGIN_CACHE_MAXSIZE = 10_000
+FAILED_LOGIN_CACHE_TTL_SECONDS = 30
+failed_login_cache: TTLCache = TTLCache(
+    maxsize=FAILED_LOGIN_CACHE_MAXSIZE, ttl=FAILED_LOGIN_CACHE_TTL_SECONDS
+)
+
+# The user lookups are built once with a bound parameter, so each call only binds the username and reuses the
+# compiled form of the statement from the engine's compiled cache; token validation only needs the identity
+# columns, so it never transfers the password hash
+SELECT_USER_BY_USERNAME = select(User).where(User.username == bindparam("username")).limit(1)
+SELECT_USER_IDENTITY_BY_USERNAME = (
+    select(User.username, User.disabled, User.role)
+    .where(User.username == bindparam("username"))
+    .limit(1)
+)
+
 
 class Token(BaseModel):
     """
@@ -139,13 +197,13 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def get_user(database_session: Session, username: str) -> Optional[UserInDB]:
+async def get_user(database_session: AsyncSession, username: str) -> Optional[UserInDB]:
     """
-    Retrieve user details from the database.
+    Retrieve user details, including the hashed password, from the database.
 
     Parameters
     ----------
-    database_session : Session
+    database_session : AsyncSession
         The database session.
     username : str
         The username to look up.
@@ -155,7 +213,8 @@ def get_user(database_session: Session, username: str) -> Optional[UserInDB]:
     Optional[UserInDB]
         A UserInDB instance if the user exists, None otherwise.
     """
-    user = database_session.query(User).filter(User.username == username).first()
+    result = await database_session.execute(SELECT_USER_BY_USERNAME, {"username": username})
+    user = result.scalar_one_or_none()
     if user:
         return UserInDB(
             username=user.username,
@@ -166,15 +225,43 @@ def get_user(database_session: Session, username: str) -> Optional[UserInDB]:
     return None
 
 
-def authenticate_user(
-    database_session: Session, username: str, password: str
+async def get_user_identity(database_session: AsyncSession, username: str) -> Optional[UserDetails]:
+    """
+    Retrieve the username, activity, and role of a user from the database, without the hashed password.
+
+    Parameters
+    ----------
+    database_session : AsyncSession
+        The database session.
+    username : str
+        The username to look up.
+
+    Returns
+    -------
+    Optional[UserDetails]
+        A UserDetails instance if the user exists, None otherwise.
+    """
+    result = await database_session.execute(
+        SELECT_USER_IDENTITY_BY_USERNAME, {"username": username}
+    )
+    row = result.one_or_none()
+    if row:
+        return UserDetails(username=row.username, disabled=row.disabled, role=row.role)
+    return None
+
+
+async def authenticate_user(
+    database_session: AsyncSession, username: str, password: str
 ) -> Union[UserInDB, bool]:
     """
     Authenticate the user by verifying the password.
 
+    Credentials that failed within the last `FAILED_LOGIN_CACHE_TTL_SECONDS` are rejected immediately.
+    Only a SHA-256 digest of the username and password is kept as the cache key, never the password itself.
+
     Parameters
     ----------
-    database_session : Session
+    database_session : AsyncSession
         The database session.
     username : str
         The username of the user.
@@ -186,10 +273,13 @@ def authenticate_user(
     Union[UserInDB, bool]
         Returns the authenticated user if successful, otherwise returns False.
     """
-    user = get_user(database_session, username)
-    if not user:
+    credentials_digest = hashlib.sha256(f"{username}\0{password}".encode("utf-8")).hexdigest()
+    if credentials_digest in failed_login_cache:
         return False
-    if not verify_password(password, user.hashed_password):
+    user = await get_user(database_session, username)
+    # bcrypt is CPU bound, so the verification runs in a worker thread to keep the event loop responsive
+    if not user or not await asyncio.to_thread(verify_password, password, user.hashed_password):
+        failed_login_cache[credentials_digest] = True
         return False
     return user
 
@@ -219,39 +309,50 @@ def create_access_token(data: Dict, expires_delta: Optional[timedelta] = None) -
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
-    database_session: Session = Depends(get_database_session),
-) -> UserInDB:
+    session_maker: async_sessionmaker[AsyncSession] = Depends(get_local_session),
+) -> UserDetails:
     """
     Retrieve the current user from the token.
 
+    Tokens that were verified within the last `TOKEN_CACHE_TTL_SECONDS` are served from `token_cache`,
+    skipping both the signature verification and the database lookup. The cache is local to each worker
+    process, and is only read and written on the event loop, so no lock is required.
+
+    The dependency receives the session maker rather than a session, and only opens a session on a cache
+    miss, so cached requests neither create a session nor touch the connection pool.
+
     Parameters
     ----------
     token : str
         The JWT access token.
-    database_session : Session
-        The database session.
+    session_maker : async_sessionmaker[AsyncSession]
+        The session maker used to open a database session when the token is not cached.
 
     Returns
     -------
-    UserInDB
-        The user associated with the provided token.
+    UserDetails
+        The user associated with the provided token, without the hashed password.
 
     Raises
     ------
     HTTPException
         If the token is invalid or expired.
     """
+    cached_entry: Optional[Tuple[UserDetails, float]] = token_cache.get(token)
+    if cached_entry is not None:
+        return cached_entry[0]
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(jwt=token, key=PUBLIC_KEY, algorithms=[ALGORITHM])
-        username: Optional[str] = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = TokenData(username=username)
+        payload = jwt.decode(
+            jwt=token,
+            key=PUBLIC_KEY,
+            algorithms=[ALGORITHM],
+            options={"require": ["exp", "sub"]},
+        )
     except ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -266,85 +367,72 @@ async def get_current_user(
             detail=f"Unexpected error: {str(error)}",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    user = get_user(database_session, username=token_data.username)
+    username: Optional[str] = payload.get("sub")
+    if username is None:
+        raise credentials_exception
+    token_data = TokenData(username=username)
+    async with session_maker() as database_session:
+        user = await get_user_identity(database_session, username=token_data.username)
     if user is None:
         raise credentials_exception
+    token_cache[token] = (user, payload["exp"])
     return user
 
 
-async def get_current_active_user(
-    current_user: Annotated[UserDetails, Depends(get_current_user)]
-) -> UserDetails:
-    """
-    Verify that the current user is active.
-
-    Parameters
-    ----------
-    current_user : UserDetails
-        The current user extracted from the token.
-
-    Returns
-    -------
-    UserDetails
-        The user if they are active.
-
-    Raises
-    ------
-    HTTPException
-        If the user is inactive.
-    """
-    if current_user.disabled:
-        raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user
-
-
-async def get_current_admin(
-    current_user: Annotated[UserDetails, Depends(get_current_user)]
-) -> UserDetails:
-    """
-    Verify that the current user is an admin.
-
-    Parameters
-    ----------
-    current_user : UserDetails
-        The current user extracted from the token.
-
-    Returns
-    -------
-    UserDetails
-        The user if they have admin permissions.
-
-    Raises
-    ------
-    HTTPException
-        If the user is not an admin.
+def require_active_user(
+    roles: Collection[str],
+) -> Callable[[UserDetails], Coroutine[Any, Any, UserDetails]]:
     """
-    if current_user.role != "admin":
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-    return current_user
+    Create a dependency that verifies the current user holds one of the given roles and is active.
 
-
-async def get_current_user_or_admin(
-    current_user: Annotated[UserDetails, Depends(get_current_user)]
-) -> UserDetails:
-    """
-    Verify that the current user is either a requester or an admin.
+    Both checks are performed by a single dependency, so each protected endpoint declares exactly one
+    authorization dependency and `get_current_user` is resolved once per request.
 
     Parameters
     ----------
-    current_user : UserDetails
-        The current user extracted from the token.
+    roles : Collection[str]
+        The roles (e.g., "admin", "requester") that are allowed to access the endpoint. They are frozen
+        into a set once, when the dependency is created, so each request performs a single hash lookup.
 
     Returns
     -------
-    UserDetails
-        The user if they have requester or admin permissions.
-
-    Raises
-    ------
-    HTTPException
-        If the user has insufficient permissions.
+    Callable[[UserDetails], Coroutine[Any, Any, UserDetails]]
+        An async dependency that returns the current user if they are authorized.
     """
-    if current_user.role not in ["requester", "admin"]:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-    return current_user
+    allowed_roles = frozenset(roles)
+
+    async def get_current_active_user_with_role(
+        current_user: Annotated[UserDetails, Depends(get_current_user)]
+    ) -> UserDetails:
+        """
+        Verify that the current user holds one of the allowed roles and is active.
+
+        Parameters
+        ----------
+        current_user : UserDetails
+            The current user extracted from the token.
+
+        Returns
+        -------
+        UserDetails
+            The user if they have the required permissions and are active.
+
+        Raises
+        ------
+        HTTPException
+            If the user has insufficient permissions or is inactive.
+        """
+        if current_user.role not in allowed_roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+            )
+        if current_user.disabled:
+            raise HTTPException(status_code=400, detail="Inactive user")
+        return current_user
+
+    return get_current_active_user_with_role
+
+
+# Authorization dependencies for the booking endpoints
+get_current_admin = require_active_user(ADMIN_ROLES)
+get_current_user_or_admin = require_active_user(USER_OR_ADMIN_ROLES)
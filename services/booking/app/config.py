@@ -1,11 +1,48 @@
 import os
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, Optional
 
 import boto3
 from pydantic_settings import BaseSettings
 
 
+@lru_cache()
+def get_secrets(environment: str) -> Dict[str, str]:
+    """
+    Fetches all secrets needed by the application from AWS Secrets Manager in a single request.
+
+    The signing keys and the database connection string are retrieved with one `BatchGetSecretValue`
+    call instead of one `GetSecretValue` call each, and the result is cached for the lifetime of the process.
+
+    Parameters
+    ----------
+    environment : str
+        The environment the application is running in, i.e., "dev" or "prod".
+
+    Returns
+    -------
+    Dict[str, str]
+        A mapping from secret name to secret string.
+
+    Raises
+    ------
+    RuntimeError
+        If any of the secrets could not be retrieved.
+    """
+    secret_ids = [
+        f"public_key_{environment}",
+        f"private_key_{environment}",
+        f"db_connection_string_{environment}",
+    ]
+    sm = boto3.client("secretsmanager")
+    response = sm.batch_get_secret_value(SecretIdList=secret_ids)
+    sm.close()
+    if response["Errors"]:
+        failed_secret_ids = [error["SecretId"] for error in response["Errors"]]
+        raise RuntimeError(f"Failed to retrieve secrets: {failed_secret_ids}")
+    return {secret["Name"]: secret["SecretString"] for secret in response["SecretValues"]}
+
+
 class BaseAppSettings(BaseSettings):
     """
     Base settings for the application.
@@ -18,6 +55,10 @@ class BaseAppSettings(BaseSettings):
         Whether the application is running in test mode.
     debug : bool
         Whether the application is running in debug mode.
+    booking_list_cache_enabled : bool
+        Whether the booking list is cached in the process, read from the BOOKING_LIST_CACHE_ENABLED
+        environment variable. The cache is only invalidated by writes served by the same process, so it must
+        only be enabled when the service runs a single process. Default is False.
     _database_url : Optional[str]
         The database connection string. Default is None.
     """
@@ -25,6 +66,7 @@ class BaseAppSettings(BaseSettings):
     environment: str
     testing: bool = False
     debug: bool = False
+    booking_list_cache_enabled: bool = False
     _database_url: Optional[str] = None
 
     @property
@@ -38,10 +80,9 @@ class BaseAppSettings(BaseSettings):
             The database connection string.
         """
         if self._database_url is None:
-            sm = boto3.client("secretsmanager")
-            self._database_url = sm.get_secret_value(
-                SecretId=f"db_connection_string_{self.environment}"
-            )["SecretString"]
+            self._database_url = get_secrets(self.environment)[
+                f"db_connection_string_{self.environment}"
+            ]
         return self._database_url
 
 
@@ -57,11 +98,14 @@ class TestSettings(BaseAppSettings):
         Overriden to True so the application runs in test mode.
     debug : bool
         Overriden to True so the application runs in debug mode.
+    booking_list_cache_enabled : bool
+        Overriden to True since the test client serves every request from the test process.
     """
 
     environment: str = "test"
     testing: bool = True
     debug: bool = True
+    booking_list_cache_enabled: bool = True
 
     @property
     def database_url(self) -> str:
@@ -87,18 +131,33 @@ def get_settings() -> BaseAppSettings:
     """
     Returns the settings based on the environment the application is running in.
 
+    The database connection string is resolved before the settings are returned, so the secret is fetched
+    exactly once, while the settings are first created, instead of lazily by whichever caller reads it first.
+
     Returns
     -------
     BaseAppSettings
         An instance of a subclass of BaseAppSettings.
+
+    Raises
+    ------
+    ValueError
+        If the ENV environment variable is invalid or the database connection string is empty.
     """
     env = os.getenv("ENV", None)
+    settings: BaseAppSettings
     match env:
         case "dev":
-            return BaseAppSettings(environment="dev", debug=True, testing=False)
+            settings = BaseAppSettings(environment="dev", debug=True, testing=False)
         case "prod":
-            return BaseAppSettings(environment="prod", debug=False, testing=False)
+            settings = BaseAppSettings(environment="prod", debug=False, testing=False)
         case "test":
-            return TestSettings(environment="test", debug=True, testing=True)
+            settings = TestSettings(environment="test", debug=True, testing=True)
         case _:
             raise ValueError(f"Invalid ENV environment variable: {env}")
+    # Resolve the database connection string eagerly, so a missing or empty one fails at startup
+    if not settings.database_url:
+        raise ValueError(
+            f"Empty database connection string for environment: {settings.environment}"
+        )
+    return settings
@@ -1,57 +1,62 @@
-from typing import Generator
+from typing import AsyncGenerator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import get_settings
 
+# The engine and its connection pool are created once per process and shared by all requests; the
+# 'postgresql+psycopg' dialect resolves to psycopg's native asyncio driver under 'create_async_engine'
+engine = create_async_engine(
+    get_settings().database_url,
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+)
+session_local = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
-def get_local_session() -> sessionmaker:
+
+def get_local_session() -> async_sessionmaker[AsyncSession]:
     """
-    Create a SQLAlchemy session maker.
+    Return the SQLAlchemy async session maker shared by the application.
 
-    This function creates a SQLAlchemy engine using the database URL from the configuration and returns a sessionmaker instance.
-    A sessionmaker is responsible for generating new session objects, which are used to interact with the database.
+    The engine backing the session maker is created once at module import using the database URL
+    from the configuration, so that all sessions check connections out of the same pool instead of
+    opening a new pool per request. A sessionmaker is responsible for generating new session objects,
+    which are used to interact with the database.
 
     For more information, see the SQLAlchemy documentation on:
 
     - Engine: https://docs.sqlalchemy.org/en/20/core/engines.html
-    - Session: https://docs.sqlalchemy.org/en/20/orm/session_basics.html#using-a-sessionmaker
+    - Pooling: https://docs.sqlalchemy.org/en/20/core/pooling.html
+    - Asyncio: https://docs.sqlalchemy.org/en/20/orm/extensions/asyncio.html
 
     Returns
     -------
-    sessionmaker
-        A SQLAlchemy sessionmaker instance, which can be used to create database sessions.
+    async_sessionmaker[AsyncSession]
+        A SQLAlchemy async sessionmaker instance, which can be used to create database sessions.
     """
-    settings = get_settings()
-    database_url = settings.database_url
-    engine = create_engine(database_url)
-
-    # Create a sessionmaker bound to the engine
-    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     return session_local
 
 
-def get_database_session() -> Generator[Session, None, None]:
+async def get_database_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to provide a database session for FastAPI requests, declared for all endpoints: submit, list, accept, and reject.
 
-    This function generates a new SQLAlchemy session for each incoming FastAPI request. The session is yielded,
+    This function generates a new SQLAlchemy async session for each incoming FastAPI request. The session is yielded,
     allowing the request to use the same session throughout its lifecycle. After the request is completed,
-    the session is closed to ensure the database connection is properly managed.
+    the session is closed to ensure the database connection is returned to the pool.
 
-    For more information on SQLAlchemy sessions, see:
-    https://docs.sqlalchemy.org/en/20/orm/session_basics.html#using-a-sessionmaker
+    Since the session is asynchronous, every database round trip suspends the request's coroutine instead of
+    blocking a worker thread, so queries from concurrent requests overlap on the event loop.
+
+    For more information on SQLAlchemy async sessions, see:
+    https://docs.sqlalchemy.org/en/20/orm/extensions/asyncio.html#using-asyncsession-with-concurrent-tasks
 
     Yields
     -------
-    Session
-        A SQLAlchemy session object, which can be used to interact with the database.
+    AsyncSession
+        A SQLAlchemy async session object, which can be used to interact with the database.
     """
-    session_local = get_local_session()
-    database_session = session_local()
-
-    try:
+    async with session_local() as database_session:
         yield database_session
-    finally:
-        database_session.close()
@@ -1,10 +1,21 @@
-from typing import List, Union, cast
+from datetime import datetime
+from typing import Any, Dict, List, Union, cast
 
 from fastapi import HTTPException
-from sqlalchemy import JSON, Boolean, DateTime, Integer, SmallInteger, String
-from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
-
-from app.models.pydantic_models import Address, BookingResponse
+from sqlalchemy import Boolean, CheckConstraint, DateTime
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy import Index, Integer, SmallInteger, String, delete, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, raiseload
+
+from app.models.pydantic_models import (
+    MAX_DURATION_MINUTES,
+    Address,
+    BookingResponse,
+    RequestStatus,
+)
 
 
 class Base(DeclarativeBase):
@@ -66,29 +77,41 @@ class Booking(Base):
         Unique identifier for the booking request (primary key).
     event_time : Column[DateTime]
         Date and time of the event associated with the booking request.
-    address : Column[JSON]
-        JSON field storing the address details for the booking.
+    address : Column[JSONB]
+        JSONB field storing the address details for the booking, kept in PostgreSQL's binary JSON format.
     duration_minutes : Column[SmallInteger]
-        Duration of the booking in minutes.
+        Duration of the booking in minutes, constrained to be positive and less than one day.
     topic : Column[String]
         Topic or subject of the booking request.
     requested_by : Column[String]
         Email address of the user who requested the booking.
-    status : Column[String]
-        Current status of the booking (maximum length 10), i.e., "pending", "approved", or "rejected".
+    status : Mapped[RequestStatus]
+        Current status of the booking, stored as the native PostgreSQL enum type "request_status", i.e.,
+        "pending", "accepted", or "rejected".
     """
 
     __tablename__ = "booking_requests"
+    __table_args__ = (
+        # Composite index serving listings filtered by status and ranged or ordered by event time
+        Index("ix_booking_requests_status_event_time", "status", "event_time"),
+        # Durations are validated on submission; the constraint guards every other write path
+        CheckConstraint(
+            f"duration_minutes > 0 AND duration_minutes < {MAX_DURATION_MINUTES}",
+            name="ck_duration_minutes_range",
+        ),
+    )
 
     id: Mapped[Integer] = mapped_column(
         Integer, primary_key=True, index=True, nullable=False, autoincrement=True
     )
     event_time: Mapped[DateTime] = mapped_column(DateTime, nullable=True)
-    address: Mapped[JSON] = mapped_column(JSON, nullable=False)
+    address: Mapped[JSONB] = mapped_column(JSONB, nullable=False)
     duration_minutes: Mapped[SmallInteger] = mapped_column(SmallInteger, nullable=False)
     topic: Mapped[String] = mapped_column(String, nullable=False)
     requested_by: Mapped[String] = mapped_column(String(100), nullable=False)
-    status: Mapped[String] = mapped_column(String(10), nullable=False)
+    status: Mapped[RequestStatus] = mapped_column(
+        SAEnum(RequestStatus, name="request_status"), nullable=False
+    )
 
     def __repr__(self) -> str:
         """
@@ -103,19 +126,93 @@ class Booking(Base):
         return f"Booking(event_time={self.event_time!r}, duration_minutes={self.duration_minutes!r}, topic={self.topic!r}, requested_by={self.requested_by!r}, status={self.status!r})"
 
 
+# The columns of a booking request record, selected or returned instead of full `Booking` entities where no ORM
+# instance is needed
+BOOKING_COLUMNS = (
+    Booking.id,
+    Booking.event_time,
+    Booking.address,
+    Booking.duration_minutes,
+    Booking.topic,
+    Booking.requested_by,
+    Booking.status,
+)
+
+# Maximum number of bookings written per statement by `DatabaseOperations.save_bookings`, which bounds the
+# number of bind parameters in each multi-row INSERT
+SAVE_BOOKINGS_BATCH_SIZE = 1000
+
+
+def booking_to_row(booking: BookingResponse) -> Dict[str, Any]:
+    """
+    Converts a booking response into the column values of a booking request record, excluding the ID.
+
+    Parameters
+    ----------
+    booking : BookingResponse
+        The booking response object to convert.
+
+    Returns
+    -------
+    Dict[str, Any]
+        A mapping from column name to value, suitable for a Core `INSERT` statement.
+    """
+    return {
+        "event_time": booking.event_time,
+        "address": booking.address.model_dump(),
+        "duration_minutes": booking.duration_minutes,
+        "topic": booking.topic,
+        "requested_by": booking.requested_by,
+        "status": booking.status,
+    }
+
+
+def booking_response_from_record(record: Any) -> BookingResponse:
+    """
+    Builds a booking response from a booking request record read from the database, without validation.
+
+    The record was validated when it was written, so the Pydantic models are created with `model_construct`,
+    which skips the validators, including the fuzzy country lookup in `Address`.
+
+    Parameters
+    ----------
+    record : Any
+        A `Booking` instance or a row with the same attributes, as returned by a column-only select.
+
+    Returns
+    -------
+    BookingResponse
+        The booking response object.
+    """
+    return BookingResponse.model_construct(
+        id=record.id,
+        event_time=record.event_time,
+        address=Address.model_construct(**record.address),
+        duration_minutes=record.duration_minutes,
+        topic=record.topic,
+        requested_by=record.requested_by,
+        status=record.status,
+    )
+
+
 class DatabaseOperations:
     """
     Class providing operations to interact with the Bookings table in the database.
 
+    The operations do not commit; the caller owns the transaction, e.g., with `async with session.begin()`,
+    so that several operations made while handling a request are committed together.
+
     Parameters
     ----------
-    session : Session
-        SQLAlchemy session used for database transactions.
+    session : AsyncSession
+        SQLAlchemy async session used for database transactions.
 
     Methods
     -------
     save_booking(booking)
         Saves a booking request to the database.
+    save_bookings(bookings)
+        Saves many booking requests to the database in multi-row statements.
     list_bookings()
         Lists all booking requests in the database.
     list_booking_by_id(id)
@@ -124,24 +221,28 @@ class DatabaseOperations:
         Deletes a specific booking request by its ID.
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         """
         Initializes a new instance of the DatabaseOperations class.
 
         Parameters
         ----------
-        session : Session
-            An SQLAlchemy session used for interacting with the database.
+        session : AsyncSession
+            An SQLAlchemy async session used for interacting with the database.
 
         Returns
         -------
         None
         """
-        self.session: Session = session
+        self.session: AsyncSession = session
 
-    def save_booking(self, booking: BookingResponse) -> None:
+    async def save_booking(self, booking: BookingResponse) -> int:
         """
-        Saves a new booking request or merges an existing one into the database.
+        Saves a new booking request or updates an existing one in the database.
+
+        The record is written with a single `INSERT ... ON CONFLICT (id) DO UPDATE ... RETURNING id`
+        statement, so no `SELECT` is issued beforehand to check whether the booking already exists, and
+        no ORM instance is created.
 
         Parameters
         ----------
@@ -149,27 +250,85 @@ class DatabaseOperations:
             The booking response object containing the details to save into the
             database.
 
+        Returns
+        -------
+        int
+            The ID of the saved booking request, generated by the database for a new booking.
+        """
+        row = booking_to_row(booking)
+        # New bookings have no ID yet, so the database generates one and there is nothing to conflict with
+        if booking.id is None:
+            statement = pg_insert(Booking).values(**row)
+        else:
+            statement = (
+                pg_insert(Booking)
+                .values(id=booking.id, **row)
+                .on_conflict_do_update(index_elements=[Booking.id], set_=row)
+            )
+        result = await self.session.execute(statement.returning(Booking.id))
+        return cast(int, result.scalar_one())
+
+    async def save_bookings(self, bookings: List[BookingResponse]) -> None:
+        """
+        Saves many new or existing booking requests to the database.
+
+        New bookings (without an ID) are inserted and existing bookings are upserted with multi-row
+        `INSERT` statements of at most `SAVE_BOOKINGS_BATCH_SIZE` rows each, instead of one statement
+        per booking.
+
+        Parameters
+        ----------
+        bookings : List[BookingResponse]
+            The booking response objects to save into the database.
+
         Returns
         -------
         None
         """
-        # Create a new booking request record
-        new_booking = Booking(
-            id=booking.id,
-            event_time=booking.event_time,
-            address=booking.address.model_dump(),
-            duration_minutes=booking.duration_minutes,
-            topic=booking.topic,
-            requested_by=booking.requested_by,
-            status=booking.status,
-        )
-        # Save the record to the database
-        self.session.merge(new_booking)
-        self.session.commit()
+        new_rows = [booking_to_row(booking) for booking in bookings if booking.id is None]
+        existing_rows = [
+            {"id": booking.id, **booking_to_row(booking)}
+            for booking in bookings
+            if booking.id is not None
+        ]
+        for start in range(0, len(new_rows), SAVE_BOOKINGS_BATCH_SIZE):
+            await self.session.execute(
+                pg_insert(Booking).values(new_rows[start : start + SAVE_BOOKINGS_BATCH_SIZE])
+            )
+        for start in range(0, len(existing_rows), SAVE_BOOKINGS_BATCH_SIZE):
+            statement = pg_insert(Booking).values(
+                existing_rows[start : start + SAVE_BOOKINGS_BATCH_SIZE]
+            )
+            # Take the updated values from the rows proposed for insertion, i.e., the 'EXCLUDED' pseudo-table
+            statement = statement.on_conflict_do_update(
+                index_elements=[Booking.id],
+                set_={
+                    column: statement.excluded[column]
+                    for column in existing_rows[0]
+                    if column != "id"
+                },
+            )
+            await self.session.execute(statement)
 
-    def list_bookings(self) -> List[BookingResponse]:
+    async def list_bookings(
+        self,
+        status: Union[RequestStatus, None] = None,
+        from_event_time: Union[datetime, None] = None,
+    ) -> List[BookingResponse]:
         """
-        Retrieves a list of all booking requests from the database.
+        Retrieves a list of booking requests from the database, optionally filtered by status and event time.
+
+        Only the booking columns are selected, so no ORM instances are created or tracked by the session.
+        The whole result is returned as a list, so the rows are fetched in one buffered round trip rather
+        than through a server-side cursor. The filters are served by the composite index on
+        (status, event_time).
+
+        Parameters
+        ----------
+        status : Union[RequestStatus, None]
+            If provided, only booking requests with this status are listed.
+        from_event_time : Union[datetime, None]
+            If provided, only booking requests whose event time is at or after this time are listed.
 
         Returns
         -------
@@ -177,21 +336,15 @@ class DatabaseOperations:
             A list of Pydantic models representing the booking responses, where
             each entry contains details of a single booking request.
         """
-        bookings = self.session.query(Booking).all()
-        return [
-            BookingResponse(
-                id=booking.id,  # type: ignore[arg-type]
-                event_time=booking.event_time,  # type: ignore[arg-type]
-                address=Address(**booking.address),  # type: ignore[arg-type]
-                duration_minutes=booking.duration_minutes,  # type: ignore[arg-type]
-                topic=booking.topic,  # type: ignore[arg-type]
-                requested_by=booking.requested_by,  # type: ignore[arg-type]
-                status=booking.status,  # type: ignore[arg-type]
-            )
-            for booking in bookings
-        ]
-
-    def list_booking_by_id(self, id: Union[int, None]) -> BookingResponse:
+        statement = select(*BOOKING_COLUMNS)
+        if status is not None:
+            statement = statement.where(Booking.status == status)
+        if from_event_time is not None:
+            statement = statement.where(Booking.event_time >= from_event_time)
+        result = await self.session.execute(statement)
+        return [booking_response_from_record(row) for row in result]
+
+    async def list_booking_by_id(self, id: Union[int, None]) -> BookingResponse:
         """
         Retrieves a specific booking request from the database by its ID.
 
@@ -206,21 +359,19 @@ class DatabaseOperations:
             A Pydantic model representing the booking response, including
             details such as event time, address, duration, topic, and status.
         """
-        booking = self.session.query(Booking).filter(Booking.id == id).first()
+        # Load by primary key; 'populate_existing' refreshes an instance already in the identity map, since
+        # bookings are written with Core statements that do not update instances held by the session
+        booking = (
+            await self.session.get(Booking, id, options=[raiseload("*")], populate_existing=True)
+            if id is not None
+            else None
+        )
         # Raise an HTTP 404 exception if the booking request is not found
         if booking is None:
             raise HTTPException(status_code=404, detail=f"Booking request with ID {id} not found.")
-        return BookingResponse(
-            id=booking.id,  # type: ignore[arg-type]
-            event_time=booking.event_time,  # type: ignore[arg-type]
-            address=Address(**booking.address),  # type: ignore[arg-type]
-            duration_minutes=booking.duration_minutes,  # type: ignore[arg-type]
-            topic=booking.topic,  # type: ignore[arg-type]
-            requested_by=booking.requested_by,  # type: ignore[arg-type]
-            status=booking.status,  # type: ignore[arg-type]
-        )
+        return booking_response_from_record(booking)
 
-    def delete_booking_by_id(self, id: Union[int, None]) -> BookingResponse:
+    async def delete_booking_by_id(self, id: Union[int, None]) -> BookingResponse:
         """
         Deletes a specific booking request from the database by its ID.
 
@@ -234,18 +385,12 @@ class DatabaseOperations:
         BookingResponse
             A Pydantic model representing the booking response that was deleted.
         """
-        booking = self.session.query(Booking).filter(Booking.id == id).first()
+        # Delete the record and return its columns in a single 'DELETE ... RETURNING' statement
+        result = await self.session.execute(
+            delete(Booking).where(Booking.id == id).returning(*BOOKING_COLUMNS)
+        )
+        booking = result.first()
         # Raise an HTTP 404 exception if the booking request is not found
         if booking is None:
             raise HTTPException(status_code=404, detail=f"Booking request with ID {id} not found.")
-        self.session.delete(booking)
-        self.session.commit()
-        return BookingResponse(
-            id=booking.id,  # type: ignore[arg-type]
-            event_time=booking.event_time,  # type: ignore[arg-type]
-            address=Address(**booking.address),  # type: ignore[arg-type]
-            duration_minutes=booking.duration_minutes,  # type: ignore[arg-type]
-            topic=booking.topic,  # type: ignore[arg-type]
-            requested_by=booking.requested_by,  # type: ignore[arg-type]
-            status=booking.status,  # type: ignore[arg-type]
-        )
+        return booking_response_from_record(booking)
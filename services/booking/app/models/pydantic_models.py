@@ -1,17 +1,54 @@
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import List
 
 import pycountry
 from pydantic import (
     BaseModel,
+    ConfigDict,
     EmailStr,
+    Field,
     PositiveInt,
     StringConstraints,
     field_validator,
 )
 from typing_extensions import Annotated, Optional
 
+# Exclusive upper bound on the duration of a booking in minutes, i.e., one day, matching the
+# 'ck_duration_minutes_range' check constraint on the booking requests table
+MAX_DURATION_MINUTES = 1440
+
+
+@lru_cache(maxsize=1024)
+def resolve_country_name(query: str) -> str:
+    """
+    Resolve a country name, code, or alias to the official country name, caching the result.
+
+    An exact (case-insensitive) match on the alpha-2 code, alpha-3 code, or any of the country names is tried
+    first, and the considerably more expensive fuzzy search is only performed if there is no exact match.
+
+    Parameters
+    ----------
+    query : str
+        The country name, code, or alias to resolve.
+
+    Returns
+    -------
+    str
+        The official country name.
+
+    Raises
+    ------
+    LookupError
+        If the query cannot be matched to any country.
+    """
+    try:
+        country = pycountry.countries.lookup(query)
+    except LookupError:
+        country = pycountry.countries.search_fuzzy(query)[0]
+    return country.name  # type: ignore[attr-defined]
+
 
 class Address(BaseModel):
     """
@@ -29,6 +66,9 @@ class Address(BaseModel):
         The country name of the address.
     """
 
+    # Addresses are never modified after validation, so instances are immutable and can be shared as-is
+    model_config = ConfigDict(frozen=True)
+
     street: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
     city: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
     state: Optional[Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]] = None
@@ -38,10 +78,8 @@ class Address(BaseModel):
     @classmethod
     def validate_country(cls, v: str) -> str:
         try:
-            # Perform a fuzzy search to find the country
-            country = pycountry.countries.search_fuzzy(v)[0]
             # Replace the input with the official country name
-            return country.name  # type: ignore[attr-defined]
+            return resolve_country_name(v)
         except LookupError:
             raise ValueError(f"'{v}' cannot be matched to any country")
 
@@ -83,8 +121,9 @@ class BookingResponse(BookingID):
         The address of the event.
     topic : str
         The topic of the event.
-    duration_minutes : PositiveInt
-        The duration of the event in minutes.
+    duration_minutes : int
+        The duration of the event in minutes. The range is enforced when the booking is submitted
+        and by a check constraint in the database, so it is not validated again here.
     requested_by : EmailStr
         The email address of the person who requested the event.
     status : str
@@ -94,7 +133,7 @@ class BookingResponse(BookingID):
     event_time: datetime
     address: Address
     topic: Annotated[str, StringConstraints(strip_whitespace=True)]
-    duration_minutes: PositiveInt
+    duration_minutes: int
     requested_by: EmailStr
     status: RequestStatus
 
@@ -132,14 +171,17 @@ class SubmissionRequest(BaseModel):
     topic : str
         The topic of the event.
     duration_minutes : PositiveInt
-        The duration of the event in minutes.
+        The duration of the event in minutes, less than `MAX_DURATION_MINUTES`.
+    requested_by : EmailStr
         The email address of the person who requested the event.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     event_time: datetime
     address: Address
     topic: Annotated[str, StringConstraints(strip_whitespace=True)]
-    duration_minutes: PositiveInt
+    duration_minutes: Annotated[PositiveInt, Field(lt=MAX_DURATION_MINUTES)]
     requested_by: EmailStr
 
 
@@ -163,3 +205,9 @@ class RejectRequest(BookingID):
     id : int
         The unique identifier of the rejected booking request.
     """
+
+
+# The Pydantic core schemas and validators are already built when the model classes above are defined; the
+# remaining cold-start cost is pycountry's country database, which is loaded lazily on the first lookup, so
+# load it at import time instead of on the first booking submission
+pycountry.countries.get(alpha_2="US")
@@ -52,8 +52,10 @@ def run_migrations_online() -> None:
 
     """
     alembic_config = config.get_section(config.config_ini_section, {})
-    print(f"The database url is {get_settings().database_url}")
-    alembic_config["sqlalchemy.url"] = get_settings().database_url
+    # Programmatic callers, e.g., the test suite, may pass the database URL through the config attributes
+    database_url = config.attributes.get("database_url", get_settings().database_url)
+    print(f"The database url is {database_url}")
+    alembic_config["sqlalchemy.url"] = database_url
     connectable = engine_from_config(
         alembic_config,
         prefix="sqlalchemy.",
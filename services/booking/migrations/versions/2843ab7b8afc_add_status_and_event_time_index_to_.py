@@ -0,0 +1,30 @@
+"""add status and event time index to booking requests
+
+Revision ID: 2843ab7b8afc
+Revises: 5c94bea21c1a
+Create Date: 2026-10-15 07:41:03.032219
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2843ab7b8afc"
+down_revision: Union[str, None] = "5c94bea21c1a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_booking_requests_status_event_time",
+        "booking_requests",
+        ["status", "event_time"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_booking_requests_status_event_time", table_name="booking_requests")
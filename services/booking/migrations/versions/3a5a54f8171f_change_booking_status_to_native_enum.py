@@ -0,0 +1,45 @@
+"""change booking status to native enum
+
+Revision ID: 3a5a54f8171f
+Revises: 2843ab7b8afc
+Create Date: 2026-10-15 07:42:41.416670
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "3a5a54f8171f"
+down_revision: Union[str, None] = "2843ab7b8afc"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+request_status = postgresql.ENUM("pending", "accepted", "rejected", name="request_status")
+
+
+def upgrade() -> None:
+    request_status.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        "booking_requests",
+        "status",
+        existing_type=sa.String(length=10),
+        type_=request_status,
+        existing_nullable=False,
+        postgresql_using="status::request_status",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "booking_requests",
+        "status",
+        existing_type=request_status,
+        type_=sa.String(length=10),
+        existing_nullable=False,
+        postgresql_using="status::text",
+    )
+    request_status.drop(op.get_bind(), checkfirst=True)
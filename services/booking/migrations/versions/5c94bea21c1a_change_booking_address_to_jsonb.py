@@ -0,0 +1,41 @@
+"""change booking address to jsonb
+
+Revision ID: 5c94bea21c1a
+Revises: 00ba29ba9ef0
+Create Date: 2026-10-15 07:33:23.883286
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "5c94bea21c1a"
+down_revision: Union[str, None] = "00ba29ba9ef0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "booking_requests",
+        "address",
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using="address::jsonb",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "booking_requests",
+        "address",
+        existing_type=postgresql.JSONB(),
+        type_=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using="address::json",
+    )
@@ -0,0 +1,53 @@
+"""add duration minutes range check to booking requests
+
+Revision ID: b6b510600726
+Revises: 3a5a54f8171f
+Create Date: 2026-10-15 07:43:48.899745
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import context, op
+
+from app.models.pydantic_models import MAX_DURATION_MINUTES
+
+# revision identifiers, used by Alembic.
+revision: str = "b6b510600726"
+down_revision: Union[str, None] = "3a5a54f8171f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same range as the constraint on the `Booking` model, built from the same bound
+DURATION_MINUTES_RANGE = f"duration_minutes > 0 AND duration_minutes < {MAX_DURATION_MINUTES}"
+
+
+def upgrade() -> None:
+    # Rows written before this revision may hold any positive duration; the upgrade fails on them
+    # instead of leaving the constraint unvalidated, since any later update of such a row would
+    # violate it
+    if not context.is_offline_mode():
+        violating_ids = (
+            op.get_bind()
+            .execute(
+                sa.text(
+                    "SELECT id FROM booking_requests "
+                    f"WHERE NOT ({DURATION_MINUTES_RANGE}) ORDER BY id"
+                )
+            )
+            .scalars()
+            .all()
+        )
+        if violating_ids:
+            raise RuntimeError(
+                f"Booking requests {violating_ids} have durations outside the range of "
+                "'ck_duration_minutes_range'; fix their durations before upgrading"
+            )
+    op.create_check_constraint(
+        "ck_duration_minutes_range", "booking_requests", DURATION_MINUTES_RANGE
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_duration_minutes_range", "booking_requests", type_="check")
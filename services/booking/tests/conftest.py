@@ -1,22 +1,35 @@
-from copy import deepcopy
+import os
 from pathlib import Path
-from typing import Generator
+from types import MappingProxyType
+from typing import AsyncGenerator, Generator
 
+import httpx
 import psycopg
 import pytest
+import pytest_asyncio
 from alembic import command
 from alembic.config import Config
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
 
+from app.api.endpoints import invalidate_booking_list_cache
+from app.auth import UserInDB, get_current_admin, get_current_user_or_admin
 from app.config import get_settings
+from app.db import get_database_session
+from app.main import app
 
 alembic_config = Config(str(Path(__file__).parents[1] / "migrations" / "alembic.ini"))
 alembic_config.set_main_option("script_location", str(Path(__file__).parents[1] / "migrations"))
 
 
 @pytest.fixture(scope="session")
-def database() -> None:
+def database() -> str:
     """
     Fixture to create and manage a test database for the session.
 
@@ -25,59 +38,231 @@ def database() -> None:
     for testing. It ensures that a clean database is available for the entire
     test session.
 
-    The fixture does not return any values but performs database creation and
-    setup at the start of the test session.
+    When the tests are distributed with `pytest-xdist`, each worker creates and
+    uses its own database, named after the test database with the worker ID,
+    e.g., `gw0`, appended, so that workers never share data.
 
     Returns
     -------
-    None
+    str
+        The connection string of the test database.
     """
-    # Create a copy of the database URL to avoid modifying the original settings
-    database_url = deepcopy(get_settings().database_url)
+    database_url = make_url(get_settings().database_url)
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker is not None:
+        database_url = database_url.set(database=f"{database_url.database}_{worker}")
     # Extract the database name from the URL
-    database_name = database_url.split("/")[-1]
-    # Connect to the default database since we cannot drop the test database that we are connected to, i.e., `database_name`
-    admin_url = database_url.rsplit("/", 1)[0] + "/postgres"
-    admin_url = admin_url.replace("postgresql+psycopg", "postgresql")
-
-    # Drop the existing database and create a new one at the start of the test session
-    with psycopg.connect(admin_url) as conn:
-        # Allow execution of DROP/CREATE DATABASE outside transactions
-        conn.autocommit = True
+    database_name = database_url.database
+    # Connect to the default database since we cannot drop the test database that we are connected to, i.e., `database_name`,
+    # using the plain driver name understood by `psycopg`
+    admin_url = database_url.set(database="postgres", drivername="postgresql").render_as_string(
+        hide_password=False
+    )
+
+    # Drop the existing database and create a new one at the start of the test session; autocommit allows
+    # execution of DROP/CREATE DATABASE outside transactions
+    with psycopg.connect(admin_url, autocommit=True) as conn:
         with conn.cursor() as cur:
             cur.execute(f"DROP DATABASE IF EXISTS {database_name}")
             cur.execute(f"CREATE DATABASE {database_name}")
+    return database_url.render_as_string(hide_password=False)
 
 
 @pytest.fixture(scope="session")
-def database_session(database) -> Generator[Session, None, None]:
+def database_engine(database: str) -> Generator[AsyncEngine, None, None]:
     """
-    Fixture to create a SQLAlchemy session for interacting with the test database.
+    Fixture to create a SQLAlchemy async engine for interacting with the test database.
 
     This fixture depends on the `database` fixture, ensuring that the test
-    database is created before initializing the SQLAlchemy session. It sets up
-    an engine using the test database URL and binds it to the session. The
-    database schema is created via SQLAlchemy's ORM at the start of the session,
-    and all tables are dropped at the end of the session for cleanup.
+    database is created before initializing the engine. The database schema is
+    created via Alembic migrations once at the start of the session; since the
+    `database` fixture recreates the database for every session, no teardown
+    migration is needed.
+
+    The engine uses `NullPool` so that no connection outlives the event loop it
+    was opened on; each database test runs on its own event loop.
 
     Parameters
     ----------
-    database : None
-        The `database` fixture ensures that the test database is created before
-        establishing a session.
+    database : str
+        The connection string of the test database created by the `database` fixture.
 
     Yields
     ------
-    sqlalchemy.orm.Session
-        A SQLAlchemy session connected to the test database, used to perform
-        transactions within the test session.
-    """
-    database_url = get_settings().database_url
-    engine = create_engine(database_url)
-    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    database_session = session_local()
+    sqlalchemy.ext.asyncio.AsyncEngine
+        A SQLAlchemy async engine connected to the test database.
+    """
+    engine = create_async_engine(database, poolclass=NullPool)
+    # Migrate the database created for this session, which differs from the settings under pytest-xdist
+    alembic_config.attributes["database_url"] = database
     command.upgrade(alembic_config, "head")
-    yield database_session
-    database_session.close()
-    command.downgrade(alembic_config, "base")
-    engine.dispose()
+    yield engine
+
+
+@pytest_asyncio.fixture
+async def database_session(database_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Fixture to create a SQLAlchemy async session for interacting with the test database.
+
+    Each test runs inside an outer transaction that is rolled back on teardown, so nothing a test writes
+    is persisted. The session joins the outer transaction by creating a savepoint, so `commit()` calls
+    made by the code under test only release the savepoint.
+
+    Parameters
+    ----------
+    database_engine : AsyncEngine
+        The async engine bound to the migrated test database.
+
+    Yields
+    ------
+    sqlalchemy.ext.asyncio.AsyncSession
+        A SQLAlchemy async session connected to the test database, used to perform
+        transactions within a test.
+    """
+    async with database_engine.connect() as connection:
+        transaction = await connection.begin()
+        database_session = AsyncSession(
+            bind=connection,
+            autoflush=False,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield database_session
+        finally:
+            await database_session.close()
+            await transaction.rollback()
+
+
+def mock_get_current_user_or_admin() -> UserInDB:
+    """
+    Mock function to return a UserInDB instance for the admin.
+
+    Returns
+    -------
+    UserInDB
+        A UserInDB instance for the admin user.
+    """
+    return UserInDB(
+        username="admin",
+        full_name="Admin User",
+        email="admin@example.com",
+        hashed_password="$2b$12$hashed_password",  # Mock hashed password
+        role="admin",
+        disabled=False,
+    )
+
+
+def mock_get_current_admin() -> UserInDB:
+    """
+    Mock function to return a UserInDB instance for the admin.
+
+    Returns
+    -------
+    UserInDB
+        A UserInDB instance for the admin user.
+    """
+    return mock_get_current_user_or_admin()
+
+
+# Authentication dependencies overridden for every request made with the test client, to bypass access control
+DEPENDENCY_OVERRIDES = MappingProxyType(
+    {
+        get_current_user_or_admin: mock_get_current_user_or_admin,
+        get_current_admin: mock_get_current_admin,
+    }
+)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    Fixture providing an asynchronous HTTP client that sends requests directly to the ASGI application.
+
+    The client and the authentication overrides in `DEPENDENCY_OVERRIDES` are set up once per session. Requests
+    are handled on the session's event loop through `httpx.ASGITransport`, without a network connection or a
+    separate event loop per request. Redirects are followed, as with Starlette's `TestClient`.
+
+    Yields
+    ------
+    httpx.AsyncClient
+        The HTTP client for the application.
+    """
+    app.dependency_overrides.update(DEPENDENCY_OVERRIDES)
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test", follow_redirects=True
+    ) as http_client:
+        yield http_client
+    # Remove only the overrides applied here, so that none of them leak past the session
+    for dependency in DEPENDENCY_OVERRIDES:
+        app.dependency_overrides.pop(dependency, None)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client_connection(database_engine: AsyncEngine) -> AsyncGenerator[AsyncConnection, None]:
+    """
+    Fixture providing the database connection shared by all requests made with the test client.
+
+    The connection is opened on the session's event loop and begins an outer transaction that is rolled
+    back at the end of the session. Each request gets its own session, which joins the outer transaction
+    by creating a savepoint, so the `async with database_session.begin()` block of a write endpoint only
+    releases that savepoint when it commits.
+
+    Parameters
+    ----------
+    database_engine : AsyncEngine
+        The async engine bound to the migrated test database.
+
+    Yields
+    ------
+    sqlalchemy.ext.asyncio.AsyncConnection
+        The connection used by every request made with the test client.
+    """
+    connection = await database_engine.connect()
+    transaction = await connection.begin()
+
+    async def mock_get_database_session() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncSession(
+            bind=connection,
+            autoflush=False,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as database_session:
+            yield database_session
+
+    # Mock database session
+    app.dependency_overrides[get_database_session] = mock_get_database_session
+    yield connection
+    app.dependency_overrides.pop(get_database_session, None)
+    await transaction.rollback()
+    await connection.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def client(
+    session_client: httpx.AsyncClient, client_connection: AsyncConnection
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    Fixture test client that allows for request to be made against the ASGI application.
+
+    Each test gets the session's client wrapped in a savepoint, which is rolled back on teardown. Since the
+    client is shared by the whole session, the app's booking list cache is also cleared on teardown, so
+    that no test is served bookings written by another one.
+
+    Parameters
+    ----------
+    session_client : httpx.AsyncClient
+        The HTTP client shared by the session.
+    client_connection : AsyncConnection
+        The connection used by every request made with the client.
+
+    Yields
+    ------
+    httpx.AsyncClient
+        The HTTP client for the application.
+    """
+    savepoint = await client_connection.begin_nested()
+    yield session_client
+    await savepoint.rollback()
+    # The booking list cached by the app outlives the test, but may hold bookings that were just rolled back
+    invalidate_booking_list_cache()
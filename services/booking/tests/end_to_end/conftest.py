@@ -0,0 +1,40 @@
+from typing import AsyncGenerator
+
+import httpx
+import pytest
+import pytest_asyncio
+
+
+@pytest.fixture(scope="module")
+def domain() -> str:
+    """
+    Fixture to get the domain of the booking service.
+
+    Returns
+    -------
+    str
+        The domain of the booking service.
+    """
+    return "https://dev.dashwu.xyz/"
+
+
+@pytest_asyncio.fixture
+async def http_client(domain: str) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    Fixture providing an asynchronous HTTP client for the booking service, shared by all requests in a test.
+
+    The client pools its connections to the booking service, so concurrent requests reuse open
+    connections instead of performing a TCP and TLS handshake per request.
+
+    Parameters
+    ----------
+    domain : str
+        The domain of the booking service, used as the base URL of the client.
+
+    Yields
+    ------
+    httpx.AsyncClient
+        The HTTP client.
+    """
+    async with httpx.AsyncClient(base_url=domain) as client:
+        yield client
@@ -1,25 +1,27 @@
+import asyncio
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, Union
-from urllib.parse import urljoin
+from uuid import uuid4
 
+import httpx
 import pytest
-import requests
 
 CustomResponse = Dict[str, Union[str, int, Dict[str, str]]]
 
-
-@pytest.fixture(scope="module")
-def domain() -> str:
-    """
-    Fixture to get the domain of the booking service from the environment variable.
-
-    Returns
-    -------
-    str
-        The domain of the booking service.
-    """
-    return "https://dev.dashwu.xyz/"
+# Number of booking flows run concurrently for each action
+CONCURRENT_FLOWS = 10
+# Fields shared by every booking submission; the event time and a unique topic are added per submission
+SUBMISSION_TEMPLATE = {
+    "address": {
+        "street": "123 Main Street",
+        "city": "Anytown",
+        "state": "NY",
+        "country": "USA",
+    },
+    "duration_minutes": 60,
+    "requested_by": "test@gmail.com",
+}
 
 
 @pytest.fixture(scope="module")
@@ -27,6 +29,11 @@ def get_auth_token(domain: str) -> str:
     """
     Get the authentication token for accessing the booking service.
 
+    Parameters
+    ----------
+    domain : str
+        The domain of the booking service.
+
     Returns
     -------
     str
@@ -35,24 +42,25 @@ def get_auth_token(domain: str) -> str:
     # Get the admin password from environment variables
     password = os.getenv("ADMIN_PASSWORD")
 
-    response = requests.post(
-        urljoin(domain, "/token"),
-        data={"username": "admin", "password": password},
-    )
+    with httpx.Client(base_url=domain) as client:
+        response = client.post("/token", data={"username": "admin", "password": password})
 
     assert response.status_code == 200, "Failed to obtain authentication token"
     token_data = response.json()
     return token_data["access_token"]
 
 
-def booking_submission(domain: str, auth_token: str) -> CustomResponse:
+async def booking_submission(http_client: httpx.AsyncClient, auth_token: str) -> CustomResponse:
     """
     Submit a booking request to the booking service at the specified endpoint.
 
+    Each submission has a unique topic, so that it can be told apart from the bookings submitted by
+    concurrent flows.
+
     Parameters
     ----------
-    domain : str
-        The domain of the booking service.
+    http_client : httpx.AsyncClient
+        The HTTP client for the booking service.
     auth_token : str
         The Bearer token for authentication.
 
@@ -62,19 +70,12 @@ def booking_submission(domain: str, auth_token: str) -> CustomResponse:
         The response JSON from the booking service after submitting the booking.
     """
     headers = {"Authorization": f"Bearer {auth_token}"}
-    response = requests.post(
-        urljoin(domain, "/booking/"),
+    response = await http_client.post(
+        "/booking/",
         json={
-            "event_time": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
-            "address": {
-                "street": "123 Main Street",
-                "city": "Anytown",
-                "state": "NY",
-                "country": "USA",
-            },
-            "topic": "Statistical Learning",
-            "duration_minutes": 60,
-            "requested_by": "test@gmail.com",
+            **SUBMISSION_TEMPLATE,
+            "event_time": datetime.now().isoformat(timespec="seconds"),
+            "topic": f"Statistical Learning {uuid4().hex}",
         },
         headers=headers,
     )
@@ -82,16 +83,16 @@ def booking_submission(domain: str, auth_token: str) -> CustomResponse:
     return response.json()
 
 
-def list_bookings(
-    domain: str, booking_response: CustomResponse, auth_token: str
+async def list_bookings(
+    http_client: httpx.AsyncClient, booking_response: CustomResponse, auth_token: str
 ) -> Union[CustomResponse, None]:
     """
     List all bookings from the booking service at the specified endpoint, ensuring that the submitted booking is listed.
 
     Parameters
     ----------
-    domain : str
-        The domain of the booking service.
+    http_client : httpx.AsyncClient
+        The HTTP client for the booking service.
     booking_response : CustomResponse
         The response JSON from the booking service after submitting the booking.
     auth_token : str
@@ -103,14 +104,14 @@ def list_bookings(
         The response JSON from the booking service after listing the bookings.
     """
     headers = {"Authorization": f"Bearer {auth_token}"}
-    response = requests.get(urljoin(domain, "/booking/"), headers=headers)
+    response = await http_client.get("/booking/", headers=headers)
     assert response.status_code == 200, "Booking listing failed"
     bookings_list = response.json().get("bookings", [])
 
     for booking in bookings_list:
-        if booking["event_time"] == booking_response["event_time"]:
+        if booking["topic"] == booking_response["topic"]:
+            assert booking["event_time"] == booking_response["event_time"]
             assert booking["address"] == booking_response["address"]
-            assert booking["topic"] == booking_response["topic"]
             assert booking["duration_minutes"] == booking_response["duration_minutes"]
             assert booking["requested_by"] == booking_response["requested_by"]
             assert booking["status"] == "pending"
@@ -119,14 +120,16 @@ def list_bookings(
     assert False, "Submitted booking not found in the list of bookings"
 
 
-def update_booking_status(domain: str, id: int, action: str, auth_token: str) -> None:
+async def update_booking_status(
+    http_client: httpx.AsyncClient, id: int, action: str, auth_token: str
+) -> None:
     """
     Update the booking status (accept or reject) at the specified endpoint.
 
     Parameters
     ----------
-    domain : str
-        The domain of the booking service.
+    http_client : httpx.AsyncClient
+        The HTTP client for the booking service.
     id : int
         The unique identifier of the booking to accept or reject.
     action : str
@@ -136,9 +139,7 @@ def update_booking_status(domain: str, id: int, action: str, auth_token: str) ->
     """
     headers = {"Authorization": f"Bearer {auth_token}"}
     assert action in ["accept", "reject"], "Invalid action. Must be 'accept' or 'reject'."
-    response = requests.post(
-        urljoin(domain, f"/booking/{action}/"), json={"id": id}, headers=headers
-    )
+    response = await http_client.post(f"/booking/{action}/", json={"id": id}, headers=headers)
     assert response.status_code == 200, f"Booking {action} failed"
     booking_response = response.json()
     expected_status = "accepted" if action == "accept" else "rejected"
@@ -146,31 +147,54 @@ def update_booking_status(domain: str, id: int, action: str, auth_token: str) ->
     return booking_response
 
 
-def delete_booking(domain: str, id: int, auth_token: str) -> None:
+async def delete_booking(http_client: httpx.AsyncClient, id: int, auth_token: str) -> None:
     """
     Delete a booking request from the booking service at the specified endpoint.
 
     Parameters
     ----------
-    domain : str
-        The domain of the booking service.
+    http_client : httpx.AsyncClient
+        The HTTP client for the booking service.
     id : int
         The unique identifier of the booking request to delete.
     auth_token : str
         The Bearer token for authentication.
     """
     headers = {"Authorization": f"Bearer {auth_token}"}
-    response = requests.delete(urljoin(domain, f"/booking/{id}/"), headers=headers)
+    response = await http_client.delete(f"/booking/{id}/", headers=headers)
     assert response.status_code == 200, "Booking deletion failed"
 
 
+async def booking_flow(http_client: httpx.AsyncClient, action: str, auth_token: str) -> None:
+    """
+    Run a single booking flow: submit a booking, find it in the listing, accept or reject it, and delete it.
+
+    Parameters
+    ----------
+    http_client : httpx.AsyncClient
+        The HTTP client for the booking service.
+    action : str
+        The action to perform on the booking, which can be either "accept" or "reject".
+    auth_token : str
+        The Bearer token for authentication.
+    """
+    booking_response_without_id = await booking_submission(http_client, auth_token)
+    booking_response_with_id = await list_bookings(
+        http_client, booking_response_without_id, auth_token
+    )
+    await update_booking_status(http_client, booking_response_with_id["id"], action, auth_token)
+    await delete_booking(http_client, booking_response_with_id["id"], auth_token)
+
+
+@pytest.mark.asyncio
 @pytest.mark.parametrize("action", ["accept", "reject"])
-def test_booking_flow(action: str, domain: str, get_auth_token: str) -> None:
+async def test_booking_flow(
+    action: str, get_auth_token: str, http_client: httpx.AsyncClient
+) -> None:
     """
-    Test the end-to-end flow of booking submission, listing, and either accepting or rejecting the booking.
+    Test the end-to-end flow of booking submission, listing, and either accepting or rejecting the booking,
+    running `CONCURRENT_FLOWS` independent flows at the same time.
     """
-    auth_token = get_auth_token
-    booking_response_without_id = booking_submission(domain, auth_token)
-    booking_response_with_id = list_bookings(domain, booking_response_without_id, auth_token)
-    update_booking_status(domain, booking_response_with_id["id"], action, auth_token)
-    delete_booking(domain, booking_response_with_id["id"], auth_token)
+    await asyncio.gather(
+        *(booking_flow(http_client, action, get_auth_token) for _ in range(CONCURRENT_FLOWS))
+    )
@@ -1,11 +1,13 @@
-import requests
+import httpx
+import pytest
 
 
-def test_health_check() -> None:
+@pytest.mark.asyncio
+async def test_health_check(http_client: httpx.AsyncClient) -> None:
     """
     Test the health check endpoint of the booking service. The health check endpoint should
     return a 200 status code and a JSON response
     """
-    response = requests.get("https://dev.dashwu.xyz/ping/")
+    response = await http_client.get("/ping/")
     assert response.status_code == 200
     assert response.json() == {"message": "ok"}
@@ -0,0 +1,229 @@
+from datetime import timedelta
+from typing import Generator, List, Tuple
+
+import pytest
+import pytest_asyncio
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import app.auth
+from app.auth import (
+    UserInDB,
+    authenticate_user,
+    create_access_token,
+    failed_login_cache,
+    get_current_user,
+    get_password_hash,
+    token_cache,
+)
+from app.models.db_models import User
+
+# Credentials of the user inserted for each test
+USERNAME = "auth_test_user"
+PASSWORD = "correct horse battery staple"
+
+
+@pytest.fixture(autouse=True)
+def signing_keys(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """
+    Fixture replacing the placeholder keys of the test environment with a freshly generated Ed25519 key pair,
+    and emptying the token and failed login caches around each test.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest fixture used to patch the keys of `app.auth`.
+
+    Yields
+    ------
+    None
+    """
+    private_key = Ed25519PrivateKey.generate()
+    monkeypatch.setattr(app.auth, "PRIVATE_KEY", private_key)
+    monkeypatch.setattr(app.auth, "PUBLIC_KEY", private_key.public_key())
+    token_cache.clear()
+    failed_login_cache.clear()
+    yield
+    token_cache.clear()
+    failed_login_cache.clear()
+
+
+@pytest_asyncio.fixture
+async def user(database_session: AsyncSession) -> User:
+    """
+    Fixture inserting a test user, which is rolled back with the rest of the test.
+
+    Parameters
+    ----------
+    database_session : AsyncSession
+        A SQLAlchemy async database session object.
+
+    Returns
+    -------
+    User
+        The inserted user, with the password `PASSWORD`.
+    """
+    user = User(
+        username=USERNAME,
+        hashed_password=get_password_hash(PASSWORD),
+        disabled=False,
+        role="requester",
+    )
+    database_session.add(user)
+    await database_session.flush()
+    return user
+
+
+@pytest.fixture
+def session_maker(database_session: AsyncSession, user: User) -> async_sessionmaker[AsyncSession]:
+    """
+    Fixture providing a session maker bound to the test's connection.
+
+    The sessions join the test's outer transaction by creating a savepoint, so they see the test user.
+
+    Parameters
+    ----------
+    database_session : AsyncSession
+        A SQLAlchemy async database session object.
+    user : User
+        The test user.
+
+    Returns
+    -------
+    async_sessionmaker[AsyncSession]
+        The session maker passed to `get_current_user`.
+    """
+    return async_sessionmaker(
+        bind=database_session.bind,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+def unavailable_session_maker() -> AsyncSession:
+    """
+    Session maker standing in for the database when a test expects it not to be queried.
+
+    Raises
+    ------
+    AssertionError
+        Always, since the database should not be queried.
+    """
+    raise AssertionError("The database should not be queried")
+
+
+class TestTokenCache(object):
+    """
+    Test the per-process cache of verified tokens used by `get_current_user`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_database(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """
+        Test that a token verified once is served from the cache, without querying the database again.
+        """
+        token = create_access_token(data={"sub": USERNAME})
+
+        user = await get_current_user(token, session_maker)
+        assert user.username == USERNAME
+        assert token in token_cache
+
+        assert await get_current_user(token, unavailable_session_maker) == user
+
+    @pytest.mark.asyncio
+    async def test_cache_entry_expires_with_token(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """
+        Test that a cache entry expires no later than the token's 'exp' claim, even though the token expires
+        before `TOKEN_CACHE_TTL_SECONDS`.
+        """
+        token = create_access_token(data={"sub": USERNAME}, expires_delta=timedelta(seconds=10))
+        await get_current_user(token, session_maker)
+        exp = token_cache[token][1]
+
+        token_cache.expire(exp - 1)
+        assert token in token_cache
+        token_cache.expire(exp)
+        assert token not in token_cache
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_rejected(self) -> None:
+        """
+        Test that an expired token, which is no longer served from the cache, is rejected with a 401 error
+        without querying the database, and is not cached.
+        """
+        token = create_access_token(data={"sub": USERNAME}, expires_delta=timedelta(seconds=-10))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(token, unavailable_session_maker)
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == "Token has expired"
+        assert token not in token_cache
+
+
+class TestFailedLoginCache(object):
+    """
+    Test the short-lived cache of failed logins used by `authenticate_user`.
+    """
+
+    @pytest.fixture
+    def verified_passwords(self, monkeypatch: pytest.MonkeyPatch) -> List[Tuple[str, str]]:
+        """
+        Fixture recording every call to `verify_password` made by `authenticate_user`.
+
+        Parameters
+        ----------
+        monkeypatch : pytest.MonkeyPatch
+            The pytest fixture used to wrap `app.auth.verify_password`.
+
+        Returns
+        -------
+        List[Tuple[str, str]]
+            The plain and hashed passwords of each verification, in call order.
+        """
+        calls: List[Tuple[str, str]] = []
+        verify_password = app.auth.verify_password
+
+        def recording_verify_password(plain_password: str, hashed_password: str) -> bool:
+            calls.append((plain_password, hashed_password))
+            return verify_password(plain_password, hashed_password)
+
+        monkeypatch.setattr(app.auth, "verify_password", recording_verify_password)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_repeated_failure_skips_verification(
+        self,
+        database_session: AsyncSession,
+        user: User,
+        verified_passwords: List[Tuple[str, str]],
+    ) -> None:
+        """
+        Test that a repeated bad credential is rejected without verifying the password again.
+        """
+        assert await authenticate_user(database_session, USERNAME, "wrong password") is False
+        assert len(verified_passwords) == 1
+
+        assert await authenticate_user(database_session, USERNAME, "wrong password") is False
+        assert len(verified_passwords) == 1
+
+    @pytest.mark.asyncio
+    async def test_correct_password_after_failure(
+        self,
+        database_session: AsyncSession,
+        user: User,
+        verified_passwords: List[Tuple[str, str]],
+    ) -> None:
+        """
+        Test that a failed login does not block the correct password of the same user.
+        """
+        assert await authenticate_user(database_session, USERNAME, "wrong password") is False
+
+        authenticated_user = await authenticate_user(database_session, USERNAME, PASSWORD)
+        assert isinstance(authenticated_user, UserInDB)
+        assert authenticated_user.username == USERNAME
+        assert len(verified_passwords) == 2
@@ -1,114 +1,95 @@
-import pytest
-from sqlalchemy.orm import Session
-from starlette.testclient import TestClient
-
-from app.auth import (
-    UserInDB,
-    get_current_active_user,
-    get_current_admin,
-    get_current_user_or_admin,
-)
-from app.db import get_database_session
-from app.main import app
-from app.models import *
+from typing import Any, Dict
 
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
 
-def mock_get_current_user_or_admin() -> UserInDB:
-    """
-    Mock function to return a UserInDB instance for the admin.
-
-    Returns
-    -------
-    UserInDB
-        A UserInDB instance for the admin user.
-    """
-    return UserInDB(
-        username="admin",
-        full_name="Admin User",
-        email="admin@example.com",
-        hashed_password="$2b$12$hashed_password",  # Mock hashed password
-        role="admin",
-        disabled=False,
-    )
+import app.api.endpoints
+from app.api.endpoints import (
+    BOOKING_LIST_CACHE_KEY,
+    booking_list_cache,
+    invalidate_booking_list_cache,
+)
+from app.models.db_models import DatabaseOperations
 
+# Booking request submitted by the `submitted_booking` fixture
+SUBMISSION_DATA = {
+    "event_time": "2024-10-03T05:07:54.259000",
+    "address": {
+        "street": "123 Main St",
+        "city": "London",
+        "state": None,
+        "country": "United Kingdom",
+    },
+    "topic": "Statistics",
+    "duration_minutes": 35,
+    "requested_by": "test@hotmail.com",
+}
+# Submission with a timezone-aware event time, sent by `test_submit_request`
+TIMEZONE_AWARE_SUBMISSION_DATA = {
+    **SUBMISSION_DATA,
+    "event_time": "2024-10-03T05:07:54.259000Z",
+    "address": {
+        **SUBMISSION_DATA["address"],
+        "city": "Springfield",
+        "state": "IL",
+        "country": "United States",
+    },
+}
+# The submissions are encoded once at import and posted as raw content, instead of being re-encoded by the
+# test client on every request
+SUBMISSION_CONTENT = orjson.dumps(SUBMISSION_DATA)
+TIMEZONE_AWARE_SUBMISSION_CONTENT = orjson.dumps(TIMEZONE_AWARE_SUBMISSION_DATA)
+JSON_HEADERS = {"Content-Type": "application/json"}
 
-def mock_get_current_admin() -> UserInDB:
-    """
-    Mock function to return a UserInDB instance for the admin.
 
-    Returns
-    -------
-    UserInDB
-        A UserInDB instance for the admin user.
+@pytest_asyncio.fixture(loop_scope="session")
+async def submitted_booking(client: httpx.AsyncClient) -> Dict[str, Any]:
     """
-    return mock_get_current_user_or_admin()
+    Fixture submitting a new booking request, which is rolled back with the rest of the test's writes.
 
-
-def mock_get_current_active_user() -> UserInDB:
-    """
-    Mock function to return a UserInDB instance for an active user.
+    Parameters
+    ----------
+    client : httpx.AsyncClient
+        The test client.
 
     Returns
     -------
-    UserInDB
-        A UserInDB instance for an active user.
-    """
-    return mock_get_current_user_or_admin()
-
-
-@pytest.fixture(scope="class")
-def client(database_session: Session) -> TestClient:
-    """
-    Fixture test client that allows for request to be made against the ASGI application.
-
-    Parameters
-    ----------
-    database_session : Session
-        SQLAlchemy session to interact with the test database.
+    Dict[str, Any]
+        The submitted booking request, including the ID generated by the database.
     """
-    # Override authentication dependencies to bypass access control
-    app.dependency_overrides[get_current_user_or_admin] = mock_get_current_user_or_admin
-    app.dependency_overrides[get_current_admin] = mock_get_current_admin
-    app.dependency_overrides[get_current_active_user] = mock_get_current_active_user
-    # Mock database session
-    app.dependency_overrides[get_database_session] = lambda: database_session
-    return TestClient(app)
+    response = await client.post("/booking/", content=SUBMISSION_CONTENT, headers=JSON_HEADERS)
+    assert response.status_code == 201
+    return response.json()
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestBookingAPI(object):
     """
     Test class for all booking-related API endpoints.
     """
 
-    def test_health_check(self, client: TestClient) -> None:
+    async def test_health_check(self, client: httpx.AsyncClient) -> None:
         """
         Test for the health check endpoint.
         """
-        response = client.get("/ping/")
+        response = await client.get("/ping/")
         assert response.status_code == 200
         assert response.json() == {"message": "ok"}
 
-    def test_submit_request(self, client: TestClient, database_session: Session) -> None:
+    async def test_submit_request(self, client: httpx.AsyncClient) -> None:
         """
         Test for the submit request endpoint.
 
         - Given a request data from a client.
         - When the client submits the request.
-        - Then the response should be a BookingResponse instance with the same data and a status of "pending". The ID should be auto-generated and is not a part of the request data nor the response data.
+        - Then the response should be a BookingResponse instance with the same data and a status of "pending". The ID should be auto-generated, so it is not a part of the request data but is a part of the response data.
         """
-        request_data = {
-            "event_time": "2024-10-03T05:07:54.259000Z",
-            "address": {
-                "street": "123 Main St",
-                "city": "Springfield",
-                "state": "IL",
-                "country": "United States",
-            },
-            "topic": "Test Topic",
-            "duration_minutes": 30,
-            "requested_by": "test@gmail.com",
-        }
-        response = client.post("/booking/", json=request_data)
+        request_data = TIMEZONE_AWARE_SUBMISSION_DATA
+        response = await client.post(
+            "/booking/", content=TIMEZONE_AWARE_SUBMISSION_CONTENT, headers=JSON_HEADERS
+        )
         assert response.status_code == 201
         response_data = response.json()
         assert response_data["event_time"] == request_data["event_time"]
@@ -117,45 +98,127 @@ class TestBookingAPI(object):
         assert response_data["duration_minutes"] == request_data["duration_minutes"]
         assert response_data["requested_by"] == request_data["requested_by"]
         assert response_data["status"] == "pending"
+        assert isinstance(response_data["id"], int)
 
-    def test_list_requests(self, client: TestClient, database_session: Session) -> None:
+    async def test_list_requests(
+        self, client: httpx.AsyncClient, submitted_booking: Dict[str, Any]
+    ) -> None:
         """
         Test for the list requests endpoint.
 
-        - Given existing requests in the database.
+        - Given an existing request in the database.
         - When the client sends a request to list all requests.
-        - Then the response should be a BookingResponseList instance with a list of BookingResponse instances, each containing the same data as the original request data and a status of "pending". The
+        - Then the response should be a BookingResponseList instance with a list of BookingResponse instances, including one with the same data as the original request data and a status of "pending". The
         ID should be a part of the response data since the database is queried.
         """
-        # Submit a request
-        request_data = {
-            "event_time": "2024-10-03T05:07:54.259000",
-            "address": {
-                "street": "123 Main St",
-                "city": "Seoul",
-                "state": None,
-                "country": "Korea, Democratic People's Republic of",
-            },
-            "topic": "Statistics",
-            "duration_minutes": 45,
-            "requested_by": "test@yahoo.com",
-        }
-        client.post("/booking/", json=request_data)
         # List all requests
-        response = client.get("/booking/")
+        response = await client.get("/booking/")
         assert response.status_code == 200
         # The response is a BookingResponseList, whose attribute "bookings" is a list of BookingResponse objects
         response_data = response.json().get("bookings")
         assert isinstance(response_data, list)
-        new_record = response_data[-1]
-        assert new_record["event_time"] == request_data["event_time"]
-        assert new_record["address"] == request_data["address"]
-        assert new_record["topic"] == request_data["topic"]
-        assert new_record["duration_minutes"] == request_data["duration_minutes"]
-        assert new_record["requested_by"] == request_data["requested_by"]
+        new_record = next(
+            booking for booking in response_data if booking["id"] == submitted_booking["id"]
+        )
+        assert new_record["event_time"] == SUBMISSION_DATA["event_time"]
+        assert new_record["address"] == SUBMISSION_DATA["address"]
+        assert new_record["topic"] == SUBMISSION_DATA["topic"]
+        assert new_record["duration_minutes"] == SUBMISSION_DATA["duration_minutes"]
+        assert new_record["requested_by"] == SUBMISSION_DATA["requested_by"]
         assert new_record["status"] == "pending"
 
-    def test_accept_request(self, client: TestClient, database_session: Session) -> None:
+    async def test_list_requests_after_submit(self, client: httpx.AsyncClient) -> None:
+        """
+        Test that the cached booking list is invalidated by the submit request endpoint.
+
+        - Given a booking list that was cached by a previous request.
+        - When the client submits a new request.
+        - Then the next request to list all requests should include the new request.
+        """
+        response = await client.get("/booking/")
+        assert response.status_code == 200
+        assert BOOKING_LIST_CACHE_KEY in booking_list_cache
+
+        response_submit = await client.post(
+            "/booking/", content=SUBMISSION_CONTENT, headers=JSON_HEADERS
+        )
+        assert response_submit.status_code == 201
+
+        response = await client.get("/booking/")
+        assert response.status_code == 200
+        booking_ids = [booking["id"] for booking in response.json()["bookings"]]
+        assert response_submit.json()["id"] in booking_ids
+
+    async def test_list_requests_after_accept(
+        self, client: httpx.AsyncClient, submitted_booking: Dict[str, Any]
+    ) -> None:
+        """
+        Test that the cached booking list is invalidated by the accept request endpoint.
+
+        - Given a booking list that was cached by a previous request, including a pending request.
+        - When the client (speaker) accepts the request.
+        - Then the next request to list all requests should show the request as "accepted".
+        """
+        response = await client.get("/booking/")
+        assert response.status_code == 200
+        assert BOOKING_LIST_CACHE_KEY in booking_list_cache
+
+        response_accept = await client.post("/booking/accept", json={"id": submitted_booking["id"]})
+        assert response_accept.status_code == 200
+
+        response = await client.get("/booking/")
+        assert response.status_code == 200
+        new_record = next(
+            booking
+            for booking in response.json()["bookings"]
+            if booking["id"] == submitted_booking["id"]
+        )
+        assert new_record["status"] == "accepted"
+
+    async def test_list_requests_during_write(
+        self, client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that a booking list read while a write invalidates the cache is not cached.
+
+        - Given a write that commits and invalidates the cache while the bookings are being read.
+        - When the client lists all requests.
+        - Then the list should be returned, but not cached, since it may miss the write.
+        """
+        list_bookings = DatabaseOperations.list_bookings
+
+        async def list_bookings_during_write(
+            self: DatabaseOperations, *args: Any, **kwargs: Any
+        ) -> Any:
+            booking_responses = await list_bookings(self, *args, **kwargs)
+            invalidate_booking_list_cache()
+            return booking_responses
+
+        monkeypatch.setattr(DatabaseOperations, "list_bookings", list_bookings_during_write)
+
+        response = await client.get("/booking/")
+        assert response.status_code == 200
+        assert BOOKING_LIST_CACHE_KEY not in booking_list_cache
+
+    async def test_list_requests_cache_disabled(
+        self, client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that the booking list is not cached when the cache is disabled, as it is for more than one process.
+
+        - Given a disabled booking list cache.
+        - When the client lists all requests.
+        - Then the list should be returned, but not cached.
+        """
+        monkeypatch.setattr(app.api.endpoints, "BOOKING_LIST_CACHE_ENABLED", False)
+
+        response = await client.get("/booking/")
+        assert response.status_code == 200
+        assert BOOKING_LIST_CACHE_KEY not in booking_list_cache
+
+    async def test_accept_request(
+        self, client: httpx.AsyncClient, submitted_booking: Dict[str, Any]
+    ) -> None:
         """
         Test for the accept request endpoint.
 
@@ -163,32 +226,16 @@ class TestBookingAPI(object):
         - When the client (speaker) wishes to accept a specific request.
         - Then the response should be an updated BookingResponse instance with the status set to "accepted".
         """
-        # Submit a request using the submit request endpoint
-        request_data = {
-            "event_time": "2024-10-03T05:07:54.259000",
-            "address": {
-                "street": "123 Main St",
-                "city": "Tokyo",
-                "state": None,
-                "country": "Japan",
-            },
-            "topic": "Statistics",
-            "duration_minutes": 25,
-            "requested_by": "test@outlook.com",
-        }
-        client.post("/booking/", json=request_data)
-        # Get the latest request using the list requests endpoint
-        response_get = client.get("/booking/")
-        response_data_get = response_get.json().get("bookings")
-        new_record = response_data_get[-1]
         # Accept the request, using the accept request endpoint; the response should be an updated BookingResponse instance
-        response_accept = client.post("/booking/accept", json={"id": new_record["id"]})
+        response_accept = await client.post("/booking/accept", json={"id": submitted_booking["id"]})
         assert response_accept.status_code == 200
         response_data_accept = response_accept.json()
-        assert response_data_accept["id"] == new_record["id"]
+        assert response_data_accept["id"] == submitted_booking["id"]
         assert response_data_accept["status"] == "accepted"
 
-    def test_reject_request(self, client: TestClient, database_session: Session) -> None:
+    async def test_reject_request(
+        self, client: httpx.AsyncClient, submitted_booking: Dict[str, Any]
+    ) -> None:
         """
         Test for the reject request endpoint.
 
@@ -196,32 +243,16 @@ class TestBookingAPI(object):
         - When the client (speaker) wishes to reject a specific request.
         - Then the response should be an updated BookingResponse instance with the status set to "rejected".
         """
-        # Submit a request using the submit request endpoint
-        request_data = {
-            "event_time": "2024-10-03T05:07:54.259000",
-            "address": {
-                "street": "123 Main St",
-                "city": "Paris",
-                "state": None,
-                "country": "France",
-            },
-            "topic": "Statistics",
-            "duration_minutes": 50,
-            "requested_by": "test@163.com",
-        }
-        client.post("/booking/", json=request_data)
-        # Get the latest request using the list requests endpoint
-        response_get = client.get("/booking/")
-        response_data_get = response_get.json().get("bookings")
-        new_record = response_data_get[-1]
         # Reject the request, using the reject request endpoint; the response should be an updated BookingResponse instance
-        response_reject = client.post("/booking/reject", json={"id": new_record["id"]})
+        response_reject = await client.post("/booking/reject", json={"id": submitted_booking["id"]})
         assert response_reject.status_code == 200
         response_data_reject = response_reject.json()
-        assert response_data_reject["id"] == new_record["id"]
+        assert response_data_reject["id"] == submitted_booking["id"]
         assert response_data_reject["status"] == "rejected"
 
-    def test_delete_request(self, client: TestClient, database_session: Session) -> None:
+    async def test_delete_request(
+        self, client: httpx.AsyncClient, submitted_booking: Dict[str, Any]
+    ) -> None:
         """
         Test for the delete request endpoint.
 
@@ -229,38 +260,13 @@ class TestBookingAPI(object):
         - When the client (speaker) wishes to delete a specific request.
         - Then the response should be a 200 OK status code with a BookingResponse instance containing the deleted request data.
         """
-        # Submit a request using the submit request endpoint
-        request_data = {
-            "event_time": "2024-10-03T05:07:54.259000",
-            "address": {
-                "street": "123 Main St",
-                "city": "London",
-                "state": None,
-                "country": "United Kingdom",
-            },
-            "topic": "Statistics",
-            "duration_minutes": 35,
-            "requested_by": "test@hotmail.com",
-        }
-        client.post("/booking/", json=request_data)
-        # Get the latest request using the list requests endpoint
-        response_get = client.get("/booking/")
-        response_data_get = response_get.json().get("bookings")
-        new_record = response_data_get[-1]
         # Delete the request, using the delete request endpoint; the response should be a BookingResponse instance containing the deleted request data
-        response_delete = client.delete(f"/booking/{new_record['id']}")
+        response_delete = await client.delete(f"/booking/{submitted_booking['id']}")
         assert response_delete.status_code == 200
-        response_data_delete = response_delete.json()
-        assert response_data_delete["id"] == new_record["id"]
-        assert response_data_delete["event_time"] == request_data["event_time"]
-        assert response_data_delete["address"] == request_data["address"]
-        assert response_data_delete["topic"] == request_data["topic"]
-        assert response_data_delete["duration_minutes"] == request_data["duration_minutes"]
-        assert response_data_delete["requested_by"] == request_data["requested_by"]
-        assert response_data_delete["status"] == "pending"
+        assert response_delete.json() == submitted_booking
 
     @pytest.mark.parametrize("endpoint", ["/booking/accept", "/booking/reject"])
-    def test_invalid_id(self, client: TestClient, database_session: Session, endpoint: str) -> None:
+    async def test_invalid_id(self, client: httpx.AsyncClient, endpoint: str) -> None:
         """
         Test for both accept and reject request endpoints with an invalid ID.
 
@@ -268,5 +274,16 @@ class TestBookingAPI(object):
         - When the client (speaker) wishes to accept or reject a specific request.
         - Then the response should be a 404 Not Found error.
         """
-        response = client.post(endpoint, json={"id": 999})
+        response = await client.post(endpoint, json={"id": 999})
         assert response.status_code == 404
+
+    async def test_malformed_json(self, client: httpx.AsyncClient) -> None:
+        """
+        Test for the submit request endpoint with a malformed JSON body.
+
+        - Given a request body that is not valid JSON.
+        - When the client submits the request.
+        - Then the response should be a 422 Unprocessable Entity error.
+        """
+        response = await client.post("/booking/", content=b'{"topic": ', headers=JSON_HEADERS)
+        assert response.status_code == 422
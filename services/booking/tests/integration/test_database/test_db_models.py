@@ -2,20 +2,21 @@ from datetime import datetime
 
 import pytest
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.db_models import DatabaseOperations
-from app.models.pydantic_models import Address, BookingResponse
+from app.models.pydantic_models import Address, BookingResponse, RequestStatus
 
 
-def test_booking_model(database_session: Session) -> None:
+@pytest.mark.asyncio
+async def test_booking_model(database_session: AsyncSession) -> None:
     """
     Test the booking model by saving a new booking request and retrieving it from the database.
 
     Parameters
     ----------
-    database_session : Session
-        A SQLAlchemy database session object.
+    database_session : AsyncSession
+        A SQLAlchemy async database session object.
     """
     # Create a new booking request response
     booking_response = BookingResponse(
@@ -36,18 +37,103 @@ def test_booking_model(database_session: Session) -> None:
     db_ops = DatabaseOperations(database_session)
 
     # Save the record to the database
-    db_ops.save_booking(booking_response)
+    await db_ops.save_booking(booking_response)
     # Newest record
-    new_record = db_ops.list_bookings()[-1]
+    new_record = (await db_ops.list_bookings())[-1]
 
     # Set the ID of the booking response, since it was originally None, but was auto-generated by the database
     booking_response.id = new_record.id
     assert new_record == booking_response
-    assert db_ops.list_booking_by_id(new_record.id) == booking_response
+    assert await db_ops.list_booking_by_id(new_record.id) == booking_response
 
     # Delete the record from the database
-    db_ops.delete_booking_by_id(new_record.id)
+    await db_ops.delete_booking_by_id(new_record.id)
     # Confirm that the record was deleted, i.e. should raise a 404 error
     with pytest.raises(HTTPException) as exc_info:
-        db_ops.list_booking_by_id(new_record.id)
+        await db_ops.list_booking_by_id(new_record.id)
     assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_save_bookings(database_session: AsyncSession) -> None:
+    """
+    Test saving many booking requests at once, inserting new records and updating existing ones.
+
+    Parameters
+    ----------
+    database_session : AsyncSession
+        A SQLAlchemy async database session object.
+    """
+    booking_responses = [
+        BookingResponse(
+            id=None,
+            event_time=datetime.now(),
+            address=Address(
+                street="123 Main Street",
+                city="Springfield",
+                state="IL",
+                country="United States",
+            ),
+            duration_minutes=30 + index,
+            topic=f"Topic {index}",
+            requested_by="test@gmail.com",
+            status="pending",
+        )
+        for index in range(3)
+    ]
+    db_ops = DatabaseOperations(database_session)
+
+    # Insert the new records, which are assigned IDs by the database
+    await db_ops.save_bookings(booking_responses)
+    new_records = (await db_ops.list_bookings())[-3:]
+    assert [record.topic for record in new_records] == ["Topic 0", "Topic 1", "Topic 2"]
+
+    # Update the existing records in one call
+    for record in new_records:
+        record.accept()
+    await db_ops.save_bookings(new_records)
+    for record in new_records:
+        assert (await db_ops.list_booking_by_id(record.id)).status == "accepted"
+        await db_ops.delete_booking_by_id(record.id)
+
+
+@pytest.mark.asyncio
+async def test_list_bookings_filters(database_session: AsyncSession) -> None:
+    """
+    Test listing booking requests filtered by status and event time.
+
+    Parameters
+    ----------
+    database_session : AsyncSession
+        A SQLAlchemy async database session object.
+    """
+    booking_responses = [
+        BookingResponse(
+            id=None,
+            event_time=datetime(2030, 1, day),
+            address=Address(
+                street="123 Main Street",
+                city="Springfield",
+                state="IL",
+                country="United States",
+            ),
+            duration_minutes=60,
+            topic=f"Topic {day}",
+            requested_by="test@gmail.com",
+            status=status,
+        )
+        for day, status in [(1, "pending"), (2, "accepted"), (3, "pending")]
+    ]
+    db_ops = DatabaseOperations(database_session)
+    await db_ops.save_bookings(booking_responses)
+
+    pending = await db_ops.list_bookings(status=RequestStatus.pending)
+    assert {"Topic 1", "Topic 3"} <= {record.topic for record in pending}
+    assert all(record.status == RequestStatus.pending for record in pending)
+
+    upcoming = await db_ops.list_bookings(
+        status=RequestStatus.pending, from_event_time=datetime(2030, 1, 2)
+    )
+    assert "Topic 3" in {record.topic for record in upcoming}
+    assert "Topic 1" not in {record.topic for record in upcoming}
+    assert all(record.event_time >= datetime(2030, 1, 2) for record in upcoming)
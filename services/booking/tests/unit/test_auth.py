@@ -0,0 +1,76 @@
+from typing import Collection, Optional
+
+import pytest
+from fastapi import HTTPException
+
+from app.auth import ADMIN_ROLES, USER_OR_ADMIN_ROLES, UserDetails, require_active_user
+
+
+class TestRequireActiveUser(object):
+    """
+    Test the authorization dependencies produced by `require_active_user`.
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "roles, role",
+        [
+            (ADMIN_ROLES, "admin"),
+            (USER_OR_ADMIN_ROLES, "requester"),
+            (USER_OR_ADMIN_ROLES, "admin"),
+        ],
+    )
+    async def test_active_user_with_role(self, roles: Collection[str], role: str) -> None:
+        """
+        Test that an active user holding one of the allowed roles is returned unchanged.
+        """
+        current_user = UserDetails(username="user", disabled=False, role=role)
+        dependency = require_active_user(roles)
+
+        assert await dependency(current_user) is current_user
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "roles, role",
+        [
+            (ADMIN_ROLES, "requester"),
+            (ADMIN_ROLES, None),
+            (USER_OR_ADMIN_ROLES, "guest"),
+        ],
+    )
+    async def test_user_without_role(self, roles: Collection[str], role: Optional[str]) -> None:
+        """
+        Test that a user without one of the allowed roles is rejected with a 403 error.
+        """
+        dependency = require_active_user(roles)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await dependency(UserDetails(username="user", disabled=False, role=role))
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.detail == "Not enough permissions"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "roles, role", [(ADMIN_ROLES, "admin"), (USER_OR_ADMIN_ROLES, "requester")]
+    )
+    async def test_inactive_user(self, roles: Collection[str], role: str) -> None:
+        """
+        Test that a disabled user holding an allowed role is rejected with a 400 error.
+        """
+        dependency = require_active_user(roles)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await dependency(UserDetails(username="user", disabled=True, role=role))
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Inactive user"
+
+    @pytest.mark.asyncio
+    async def test_inactive_user_without_role(self) -> None:
+        """
+        Test that the role is checked first, so a disabled user without an allowed role gets a 403 error.
+        """
+        dependency = require_active_user(ADMIN_ROLES)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await dependency(UserDetails(username="user", disabled=True, role="requester"))
+        assert exc_info.value.status_code == 403
@@ -3,7 +3,16 @@ from datetime import datetime
 import pytest
 from pydantic import ValidationError
 
-from app.models.pydantic_models import Address, BookingResponse
+from app.models.pydantic_models import Address, BookingResponse, SubmissionRequest
+
+# Addresses shared by the parametrized test cases, validated once at import instead of once per test case
+SAN_FRANCISCO_ADDRESS = Address(
+    street="1234 Main St", city="San Francisco", state="CA", country="USA"
+)
+TORONTO_ADDRESS = Address(street="1234 Main St", city="Toronto", state="Ontario", country="Canada")
+TOKYO_ADDRESS = Address(street="1234 Main St", city="Tokyo", state=None, country="Japan")
+# Fixed event time for the parametrized test cases, so that collection is deterministic
+EVENT_TIME = datetime(2024, 10, 3, 5, 7, 54)
 
 
 class TestAddress(object):
@@ -20,6 +29,16 @@ class TestAddress(object):
             ("1234 Main St", "Tokyo", None, "JP", "Japan"),
             # Valid address with different country name
             ("1234 Main St", "London", None, "Great Britain", "United Kingdom"),
+            # Exact country name that is also a prefix of another country's name
+            ("1234 Main St", "Niamey", None, "Niger", "Niger"),
+            # Official country name containing a comma and an apostrophe
+            (
+                "1234 Main St",
+                "Pyongyang",
+                None,
+                "Korea, Democratic People's Republic of",
+                "Korea, Democratic People's Republic of",
+            ),
         ],
         scope="function",
     )
@@ -80,8 +99,8 @@ class TestBookingResponse(object):
         [
             (
                 12,
-                datetime.now(),
-                Address(street="1234 Main St", city="San Francisco", state="CA", country="USA"),
+                EVENT_TIME,
+                SAN_FRANCISCO_ADDRESS,
                 "Machine Learning and AI",
                 60,
                 "test@gmail.com",
@@ -90,7 +109,7 @@ class TestBookingResponse(object):
             (
                 17,
                 datetime(2022, 1, 1, 12, 0),
-                Address(street="1234 Main St", city="Toronto", state="Ontario", country="Canada"),
+                TORONTO_ADDRESS,
                 "Statistics",
                 120,
                 "requester@yahoo.com",
@@ -99,7 +118,7 @@ class TestBookingResponse(object):
             (
                 27,
                 datetime(2024, 12, 27, 0, 0),
-                Address(street="1234 Main St", city="Tokyo", state=None, country="Japan"),
+                TOKYO_ADDRESS,
                 "Data Engineering",
                 90,
                 "team@outlook.com",
@@ -138,28 +157,18 @@ class TestBookingResponse(object):
             # Invalid status
             (
                 12,
-                datetime.now(),
-                Address(street="1234 Main St", city="San Francisco", state="CA", country="USA"),
+                EVENT_TIME,
+                SAN_FRANCISCO_ADDRESS,
                 "Machine Learning",
                 60,
                 "test@gmail.com",
                 "invalid_status",
             ),
-            # Invalid duration (0 minutes)
-            (
-                12,
-                datetime.now(),
-                Address(street="1234 Main St", city="San Francisco", state="CA", country="USA"),
-                "Machine Learning",
-                0,
-                "test@gmail.com",
-                "pending",
-            ),
             # Invalid email
             (
                 12,
-                datetime.now(),
-                Address(street="1234 Main St", city="San Francisco", state="CA", country="USA"),
+                EVENT_TIME,
+                SAN_FRANCISCO_ADDRESS,
                 "Machine Learning",
                 60,
                 "invalid_email",
@@ -184,3 +193,34 @@ class TestBookingResponse(object):
                 requested_by=requested_by,
                 status=status,
             )
+
+
+class TestSubmissionRequest(object):
+    """
+    Test the SubmissionRequest model in the booking service.
+    """
+
+    @pytest.mark.parametrize(
+        "duration_minutes",
+        [
+            # Zero minutes
+            0,
+            # Negative duration
+            -30,
+            # A full day or longer
+            1440,
+        ],
+        scope="function",
+    )
+    def test_invalid_duration(self, duration_minutes) -> None:
+        """
+        Test that durations outside the range allowed by the database are rejected on submission.
+        """
+        with pytest.raises(ValidationError):
+            SubmissionRequest(
+                event_time=EVENT_TIME,
+                address=SAN_FRANCISCO_ADDRESS,
+                topic="Machine Learning",
+                duration_minutes=duration_minutes,
+                requested_by="test@gmail.com",
+            )
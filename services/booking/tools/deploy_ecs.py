@@ -1,10 +1,14 @@
+import hashlib
+import json
 import logging
 import sys
-import time
 from argparse import ArgumentParser
-from typing import Collection, Dict, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Collection, Dict, Sequence
 
 import boto3
+from botocore.exceptions import WaiterError
+from botocore.waiter import WaiterModel, create_waiter_with_client
 from mypy_boto3_ecs import ECSClient
 
 logger = logging.getLogger(name="deploy_ecs")
@@ -13,8 +17,27 @@ handler = logging.StreamHandler(sys.stdout)
 logger.addHandler(handler)
 TaskDefinition = Dict[str, Collection[Collection[str]]]
 
-
-def generate_task_definition(env: str, image_uri: str) -> TaskDefinition:
+# Task definition parameters compared against the latest registered revision of the family; a new revision is
+# only registered if any of them changed
+COMPARED_TASK_DEFINITION_KEYS = (
+    "containerDefinitions",
+    "taskRoleArn",
+    "executionRoleArn",
+    "networkMode",
+    "volumes",
+    "requiresCompatibilities",
+    "cpu",
+    "memory",
+    "runtimePlatform",
+)
+
+# Number of gunicorn worker processes per container; the per-process booking list cache is only enabled when
+# the service runs a single container with a single worker, since writes only invalidate the cache of the
+# process that served them
+GUNICORN_WORKERS = 1
+
+
+def generate_task_definition(env: str, image_uri: str, container_count: int) -> TaskDefinition:
     """
     Generate a new ECS task definition for the booking service.
 
@@ -24,6 +47,8 @@ def generate_task_definition(env: str, image_uri: str) -> TaskDefinition:
         The deployment environment, either 'dev' or 'prod'.
     image_uri : str
         The URL of the Docker image to deploy.
+    container_count : int
+        The number of containers the service runs, which decides whether the booking list cache is enabled.
 
     Returns
     -------
@@ -45,10 +70,16 @@ def generate_task_definition(env: str, image_uri: str) -> TaskDefinition:
                     "app.main:app",
                     "-k",
                     "uvicorn.workers.UvicornWorker",
+                    "--workers",
+                    str(GUNICORN_WORKERS),
                 ],
                 "environment": [
                     {"name": "ENV", "value": env},
                     {"name": "DOCS_URL", "value": "/docs" if env == "dev" else ""},
+                    {
+                        "name": "BOOKING_LIST_CACHE_ENABLED",
+                        "value": str(container_count == 1 and GUNICORN_WORKERS == 1).lower(),
+                    },
                 ],
                 "logConfiguration": {
                     "logDriver": "awslogs",
@@ -76,6 +107,94 @@ def generate_task_definition(env: str, image_uri: str) -> TaskDefinition:
     return task_definition
 
 
+def task_definition_fingerprint(task_definition: Dict[str, Any]) -> str:
+    """
+    Compute a fingerprint of a task definition from its canonical JSON representation.
+
+    Parameters
+    ----------
+    task_definition : Dict[str, Any]
+        The task definition parameters.
+
+    Returns
+    -------
+    str
+        The SHA-256 hex digest of the task definition serialized with sorted keys.
+    """
+    return hashlib.sha256(
+        json.dumps(task_definition, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def restrict_to(registered: Any, generated: Any) -> Any:
+    """
+    Restrict a registered task definition value to the structure of the generated one.
+
+    ECS fills in defaults, e.g., `mountPoints` or `cpu` on each container definition, when a task definition
+    is registered; dropping the keys absent from the generated value makes the two comparable.
+
+    Parameters
+    ----------
+    registered : Any
+        The value as returned by `describe_task_definition`.
+    generated : Any
+        The value as generated by `generate_task_definition`.
+
+    Returns
+    -------
+    Any
+        The registered value, restricted to the keys present in the generated value.
+    """
+    if isinstance(registered, dict) and isinstance(generated, dict):
+        return {key: restrict_to(registered.get(key), value) for key, value in generated.items()}
+    if isinstance(registered, list) and isinstance(generated, list):
+        if len(registered) != len(generated):
+            return registered
+        return [restrict_to(item, value) for item, value in zip(registered, generated)]
+    return registered
+
+
+def register_task_definition(ecs_client: ECSClient, task_definition: TaskDefinition) -> str:
+    """
+    Register the task definition, unless the latest revision of its family is identical to it.
+
+    The parameters in `COMPARED_TASK_DEFINITION_KEYS` are fingerprinted and compared against the latest
+    active revision of the family, so that a no-op redeploy reuses that revision instead of registering
+    a new one.
+
+    Parameters
+    ----------
+    ecs_client : ECSClient
+        The ECS client.
+    task_definition : TaskDefinition
+        The ECS task definition.
+
+    Returns
+    -------
+    str
+        The ARN of the task definition revision to deploy.
+    """
+    family = str(task_definition["family"])
+    generated = {key: task_definition[key] for key in COMPARED_TASK_DEFINITION_KEYS}
+    try:
+        registered = ecs_client.describe_task_definition(taskDefinition=family)["taskDefinition"]
+    except ecs_client.exceptions.ClientException:
+        # The family has no active revision yet, e.g., on the first deploy
+        logger.info(f"No active revision found for task definition family {family}")
+    else:
+        if task_definition_fingerprint(
+            restrict_to(registered, generated)
+        ) == task_definition_fingerprint(generated):
+            task_definition_arn = registered["taskDefinitionArn"]
+            logger.info(f"Task definition is unchanged, reusing: {task_definition_arn}")
+            return task_definition_arn
+
+    response = ecs_client.register_task_definition(**task_definition)  # type: ignore
+    task_definition_arn = response["taskDefinition"]["taskDefinitionArn"]
+    logger.info(f"Registered new task definition: {task_definition_arn}")
+    return task_definition_arn
+
+
 def migrations(
     env: str,
     ecs_client: ECSClient,
@@ -83,10 +202,12 @@ def migrations(
     task_definition_arn: str,
     subnet_ids: Sequence[str],
     security_group_id: Sequence[str],
-) -> None:
+) -> str:
     """
     Apply migrations to the database in a standalone container independent of the service. The same image for deployment is reused for the migration.
 
+    The task is started but not waited on; see `wait_for_migrations`.
+
     Parameters
     ----------
     env : str
@@ -101,6 +222,11 @@ def migrations(
         The subnet IDs for the ECS task.
     security_group_id : Sequence[str]
         The security group IDs for the ECS task.
+
+    Returns
+    -------
+    str
+        The ARN of the migration task.
     """
     response = ecs_client.run_task(
         cluster=cluster_name,
@@ -125,7 +251,114 @@ def migrations(
             ]
         },
     )
-    logger.info(f"Running migrations in a standalone container: {response['tasks'][0]['taskArn']}")
+    task_arn = response["tasks"][0]["taskArn"]
+    logger.info(f"Running migrations in a standalone container: {task_arn}")
+    return task_arn
+
+
+def wait_for_migrations(ecs_client: ECSClient, cluster_name: str, task_arn: str) -> None:
+    """
+    Wait for the migration task to stop and check that its container exited successfully.
+
+    Parameters
+    ----------
+    ecs_client : ECSClient
+        The ECS client.
+    cluster_name : str
+        The ECS cluster name.
+    task_arn : str
+        The ARN of the migration task.
+    """
+    waiter = ecs_client.get_waiter("tasks_stopped")
+    waiter.wait(cluster=cluster_name, tasks=[task_arn])
+    task = ecs_client.describe_tasks(cluster=cluster_name, tasks=[task_arn])["tasks"][0]
+    exit_codes = [container.get("exitCode") for container in task["containers"]]
+    if any(exit_code != 0 for exit_code in exit_codes):
+        logger.error(f"Migration task {task_arn} failed with exit codes {exit_codes}")
+        raise RuntimeError("Migrations failed")
+    logger.info(f"Migration task {task_arn} completed")
+
+
+def get_container_count(ecs_client: ECSClient, cluster_name: str, service_name: str) -> int:
+    """
+    Get the number of containers the ECS service is configured to run.
+
+    Parameters
+    ----------
+    ecs_client : ECSClient
+        The ECS client.
+    cluster_name : str
+        The ECS cluster name.
+    service_name : str
+        The ECS service name.
+
+    Returns
+    -------
+    int
+        The desired count of the service.
+    """
+    response = ecs_client.describe_services(cluster=cluster_name, services=[service_name])
+    return response["services"][0]["desiredCount"]
+
+
+def update_service(
+    ecs_client: ECSClient, cluster_name: str, service_name: str, task_definition_arn: str
+) -> None:
+    """
+    Update the ECS service to run the given task definition.
+
+    Parameters
+    ----------
+    ecs_client : ECSClient
+        The ECS client.
+    cluster_name : str
+        The ECS cluster name.
+    service_name : str
+        The ECS service name.
+    task_definition_arn : str
+        The ARN of the ECS task definition.
+    """
+    ecs_client.update_service(
+        cluster=cluster_name, service=service_name, taskDefinition=task_definition_arn
+    )
+    logger.info(f"Updated service: {service_name}")
+
+
+# Waiter on the rollout state of the service's primary deployment: unlike the built-in 'services_stable' waiter,
+# which keeps polling a failed rollout until it times out, it stops as soon as the deployment circuit breaker
+# marks the rollout as failed; the delay and maximum attempts are overridden by each call
+SERVICE_ROLLOUT_WAITER_MODEL = WaiterModel(
+    {
+        "version": 2,
+        "waiters": {
+            "ServiceRolloutCompleted": {
+                "operation": "DescribeServices",
+                "delay": 15,
+                "maxAttempts": 40,
+                "acceptors": [
+                    {
+                        "matcher": "pathAny",
+                        "argument": "failures[].reason",
+                        "expected": "MISSING",
+                        "state": "failure",
+                    },
+                    {
+                        "matcher": "path",
+                        "argument": "services[0].deployments[?status=='PRIMARY'] | [0].rolloutState",
+                        "expected": "FAILED",
+                        "state": "failure",
+                    },
+                    {
+                        "matcher": "path",
+                        "argument": "services[0].deployments[?status=='PRIMARY'] | [0].rolloutState",
+                        "expected": "COMPLETED",
+                        "state": "success",
+                    },
+                ],
+            }
+        },
+    }
+)
 
 
 def wait_for_service_stable(
@@ -136,7 +369,11 @@ def wait_for_service_stable(
     delay: int = 10,
 ):
     """
-    Wait for ECS service to become stable and log task counts.
+    Wait for the rollout of the ECS service to complete and log task counts.
+
+    A single waiter built from `SERVICE_ROLLOUT_WAITER_MODEL` polls the service until the rollout state of
+    its primary deployment is "COMPLETED", and fails as soon as it is "FAILED"; the task counts are logged
+    from each of its `DescribeServices` responses, so no additional calls are made for logging.
 
     Parameters
     ----------
@@ -151,43 +388,32 @@ def wait_for_service_stable(
     delay : int
         The time interval between status checks, in seconds.
     """
-    waiter = ecs_client.get_waiter("services_stable")
-    logger.info(f"Waiting for service {service_name} to stabilize...")
-
-    start_time = time.time()
 
-    while time.time() - start_time < timeout:
-        # Describe the service to get task counts
-        response = ecs_client.describe_services(cluster=cluster_name, services=[service_name])
-        service = response["services"][0]
-        running_count = service["runningCount"]
-        pending_count = service["pendingCount"]
-        desired_count = service["desiredCount"]
-
-        logger.info(
-            f"Service {service_name}: runningCount = {running_count}, pendingCount = {pending_count}, desiredCount = {desired_count}"
-        )
-
-        # Check if the desired count has been reached
-        if running_count == desired_count:
+    def log_task_counts(parsed: Dict[str, Any], **kwargs: Any) -> None:
+        for service in parsed.get("services", []):
             logger.info(
-                f"Service {service_name} has reached the desired count of {desired_count} tasks"
+                f"Service {service['serviceName']}: runningCount = {service['runningCount']}, pendingCount = {service['pendingCount']}, desiredCount = {service['desiredCount']}"
             )
-            break
-
-        # Wait for the specified delay before checking again
-        time.sleep(delay)
-
-    if time.time() - start_time >= timeout:
-        logger.error(f"Service {service_name} did not stabilize within {timeout} seconds")
-        raise TimeoutError("Service stabilization timed out")
 
-    # Use waiter to ensure the service is stable
-    waiter.wait(
-        cluster=cluster_name,
-        services=[service_name],
-        WaiterConfig={"Delay": delay, "MaxAttempts": timeout // delay},
+    waiter = create_waiter_with_client(
+        "ServiceRolloutCompleted", SERVICE_ROLLOUT_WAITER_MODEL, ecs_client
     )
+    logger.info(f"Waiting for service {service_name} to stabilize...")
+
+    ecs_client.meta.events.register("after-call.ecs.DescribeServices", log_task_counts)
+    try:
+        waiter.wait(
+            cluster=cluster_name,
+            services=[service_name],
+            WaiterConfig={"Delay": delay, "MaxAttempts": timeout // delay},
+        )
+    except WaiterError as error:
+        logger.error(f"Service {service_name} did not stabilize: {error}")
+        if "Max attempts exceeded" in str(error):
+            raise TimeoutError("Service stabilization timed out") from error
+        raise
+    finally:
+        ecs_client.meta.events.unregister("after-call.ecs.DescribeServices", log_task_counts)
     logger.info(f"Service {service_name} is stable")
 
 
@@ -221,28 +447,49 @@ def main() -> int:
         required=True,
         help="The security group ID for the ECS task",
     )
+    parser.add_argument(
+        "--concurrent_migrations",
+        action="store_true",
+        help="Update the service while the migrations run instead of after they complete, only for migrations compatible with the running revision",
+    )
     args, _ = parser.parse_known_args()
 
     ecs_client: ECSClient = boto3.client("ecs")
 
-    task_definition = generate_task_definition(env=args.env, image_uri=args.image_uri)
-    response = ecs_client.register_task_definition(**task_definition)  # type: ignore
-    task_definition_arn = response["taskDefinition"]["taskDefinitionArn"]
-    logger.info(f"Registered new task definition: {task_definition_arn}")
-
-    migrations(
-        env=args.env,
-        ecs_client=ecs_client,
-        cluster_name=args.cluster_name,
-        task_definition_arn=task_definition_arn,
-        subnet_ids=args.subnet_ids,
-        security_group_id=args.security_group_id,
+    container_count = get_container_count(ecs_client, args.cluster_name, args.service_name)
+    task_definition = generate_task_definition(
+        env=args.env, image_uri=args.image_uri, container_count=container_count
     )
-
-    response = ecs_client.update_service(
-        cluster=args.cluster_name, service=args.service_name, taskDefinition=task_definition_arn
-    )  # type: ignore
-    logger.info(f"Updated service: {args.service_name}")
+    task_definition_arn = register_task_definition(ecs_client, task_definition)
+
+    migrations_kwargs = {
+        "env": args.env,
+        "ecs_client": ecs_client,
+        "cluster_name": args.cluster_name,
+        "task_definition_arn": task_definition_arn,
+        "subnet_ids": args.subnet_ids,
+        "security_group_id": args.security_group_id,
+    }
+    update_service_kwargs = {
+        "ecs_client": ecs_client,
+        "cluster_name": args.cluster_name,
+        "service_name": args.service_name,
+        "task_definition_arn": task_definition_arn,
+    }
+    if args.concurrent_migrations:
+        # Opted into for additive migrations, which are compatible with both revisions, so the rollout
+        # does not wait for them; boto3 clients are thread-safe, so both calls share the same client
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            migrations_future = executor.submit(migrations, **migrations_kwargs)
+            update_service_future = executor.submit(update_service, **update_service_kwargs)
+            update_service_future.result()
+            migration_task_arn = migrations_future.result()
+        # The rollout did not wait for the migrations, but the deployment still fails if they did
+        wait_for_migrations(ecs_client, args.cluster_name, migration_task_arn)
+    else:
+        migration_task_arn = migrations(**migrations_kwargs)
+        wait_for_migrations(ecs_client, args.cluster_name, migration_task_arn)
+        update_service(**update_service_kwargs)
 
     # Wait for the service to stabilize
     wait_for_service_stable(
@@ -1,33 +1,81 @@
+from __future__ import annotations
+
 import logging
-import secrets
+import os
 import string
 import sys
+import time
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
+import bcrypt
 import boto3
+import psycopg
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from mypy_boto3_secretsmanager import SecretsManagerClient
-from passlib.context import CryptContext
-from sqlalchemy import create_engine, text
-from sqlalchemy.exc import SQLAlchemyError
+
+# The client stubs are only needed by the type checker, and importing them at runtime adds to the start-up time of
+# every rotation task
+if TYPE_CHECKING:
+    from mypy_boto3_secretsmanager import SecretsManagerClient
 
 logger = logging.getLogger(name="manage_passwords")
 logger.setLevel(logging.INFO)
 handler = logging.StreamHandler(sys.stdout)
 logger.addHandler(handler)
+# Fail fast on an unreachable endpoint instead of waiting out botocore's 60 second timeouts, and back off with the
+# client-side rate limiting of the adaptive retry mode when AWS throttles the calls
+BOTO_CONFIG = Config(
+    connect_timeout=3,
+    read_timeout=10,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+)
+# The bcrypt cost factor, i.e., the log2 of the number of key expansion rounds, so each extra round doubles the CPU
+# time spent hashing and verifying a password (a cost of 10 does a quarter of the work of 12); the ECS task started
+# by `manage_passwords_trigger.py` sets it through the environment
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Generated passwords are drawn from these characters, using the low bits of each random byte selected by the mask
+# and `PASSWORD_RANDOM_BYTES` random bytes at a time; about three in four bytes map to a character
+PASSWORD_CHARACTERS = (string.ascii_letters + string.digits + string.punctuation).encode()
+PASSWORD_CHARACTER_MASK = (1 << len(PASSWORD_CHARACTERS).bit_length()) - 1
+PASSWORD_LENGTH = 16
+PASSWORD_RANDOM_BYTES = 64
+# Lookup tables for `bytes.translate`, which maps a batch of random bytes to characters in a single C-level pass: the
+# byte values whose masked index is past the last character are deleted, and every other byte value is translated
+# to the character at its masked index
+PASSWORD_REJECTED_BYTES = bytes(
+    byte for byte in range(256) if byte & PASSWORD_CHARACTER_MASK >= len(PASSWORD_CHARACTERS)
+)
+PASSWORD_TRANSLATION_TABLE = bytes(
+    PASSWORD_CHARACTERS[(byte & PASSWORD_CHARACTER_MASK) % len(PASSWORD_CHARACTERS)]
+    for byte in range(256)
+)
 
 
 def generate_strong_password() -> str:
     """
     Generate a strong random password.
 
+    The password is drawn from a batch of random bytes from `os.urandom`. Each byte is masked down to the
+    smallest power of two covering `PASSWORD_CHARACTERS`, and masked values past the last character are
+    rejected, so every character is equally likely. Both steps are done by `bytes.translate` with the
+    precomputed `PASSWORD_TRANSLATION_TABLE` and `PASSWORD_REJECTED_BYTES`.
+
     Returns
     -------
     str
         The generated strong password.
     """
-    characters = string.ascii_letters + string.digits + string.punctuation
-    return "".join(secrets.choice(characters) for _ in range(16))
+    password = b""
+    # A batch of random bytes almost always yields enough characters, but draw another one if it does not
+    while len(password) < PASSWORD_LENGTH:
+        password += os.urandom(PASSWORD_RANDOM_BYTES).translate(
+            PASSWORD_TRANSLATION_TABLE, PASSWORD_REJECTED_BYTES
+        )
+    return password[:PASSWORD_LENGTH].decode()
 
 
 def store_password(sm_client: SecretsManagerClient, secret_name: str, password: str) -> None:
@@ -89,12 +137,15 @@ def upsert_user_password(
     db_connection_string: str, username: str, hashed_password: str, role: str, disabled: bool
 ) -> None:
     """
-    Insert or update the user password in the database using SQLAlchemy.
+    Insert or update the user password in the database using psycopg.
+
+    The single upsert is sent over a plain `psycopg` connection rather than a SQLAlchemy engine, which
+    would run its dialect initialization queries on the first connection before executing it.
 
     Parameters
     ----------
     db_connection_string : str
-        The database connection string.
+        The database connection string, i.e., a SQLAlchemy URL such as `postgresql+psycopg://...`.
     username : str
         The username for which the password should be updated or inserted.
     hashed_password : str
@@ -104,38 +155,42 @@ def upsert_user_password(
     disabled : bool
         Whether the user account is disabled.
     """
-    engine = create_engine(db_connection_string)
+    # Use the plain scheme understood by `psycopg`; the rest of the URL, including its percent-encoded
+    # password, is passed through unchanged
+    conninfo = urlsplit(db_connection_string)._replace(scheme="postgresql").geturl()
     try:
-        with engine.connect() as conn:
-            with conn.begin():
-                query = text(
-                    """
-                    INSERT INTO users (username, hashed_password, role, disabled)
-                    VALUES (:username, :hashed_password, :role, :disabled)
-                    ON CONFLICT (username) 
-                    DO UPDATE SET 
-                        hashed_password = EXCLUDED.hashed_password, 
-                        role = EXCLUDED.role, 
-                        disabled = EXCLUDED.disabled
+        # The transaction is committed when the connection block exits without an error
+        with psycopg.connect(conninfo) as conn:
+            conn.execute(
                 """
-                )
-                conn.execute(
-                    query,
-                    {
-                        "username": username,
-                        "hashed_password": hashed_password,
-                        "role": role,
-                        "disabled": disabled,
-                    },
-                )
-            logger.info(f"Password updated or inserted in DB for user: {username}")
-    except SQLAlchemyError as error:
+                INSERT INTO users (username, hashed_password, role, disabled)
+                VALUES (%(username)s, %(hashed_password)s, %(role)s, %(disabled)s)
+                ON CONFLICT (username) 
+                DO UPDATE SET 
+                    hashed_password = EXCLUDED.hashed_password, 
+                    role = EXCLUDED.role, 
+                    disabled = EXCLUDED.disabled
+                """,
+                {
+                    "username": username,
+                    "hashed_password": hashed_password,
+                    "role": role,
+                    "disabled": disabled,
+                },
+            )
+        logger.info(f"Password updated or inserted in DB for user: {username}")
+    except psycopg.Error as error:
         logger.error(f"Failed to update password in DB: {error}")
         raise
 
 
 def manage_passwords(
-    env: str, sm_client: SecretsManagerClient, username: str, role: str, disabled: bool
+    env: str,
+    sm_client: SecretsManagerClient,
+    username: str,
+    role: str,
+    disabled: bool,
+    bcrypt_rounds: int = BCRYPT_ROUNDS,
 ) -> None:
     """
     Rotate passwords for a specified user, store it in AWS Secrets Manager,
@@ -153,17 +208,34 @@ def manage_passwords(
         The role of the user (e.g., 'admin', 'requester').
     disabled : bool
         Whether the user account is disabled.
+    bcrypt_rounds : int, optional
+        The bcrypt cost factor used to hash the password, by default `BCRYPT_ROUNDS`.
     """
     try:
         # Generate new password
         password = generate_strong_password()
-        # Store password in Secrets Manager
-        store_password(sm_client, f"{username}_password_{env}", password)
-        # Fetch the DB connection string from Secrets Manager
-        db_connection_string = get_db_connection_string(sm_client, f"db_connection_string_{env}")
-        # Hash password before storing in DB
-        pwd_context = CryptContext(schemes=["bcrypt"])
-        hashed_password = pwd_context.hash(password)
+        # Storing the password and fetching the DB connection string are independent Secrets Manager calls, so
+        # they run in the background while the password is hashed; boto3 clients are thread-safe, and bcrypt
+        # releases the GIL while hashing
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Store password in Secrets Manager
+            store_password_future = executor.submit(
+                store_password, sm_client, f"{username}_password_{env}", password
+            )
+            # Fetch the DB connection string from Secrets Manager
+            db_connection_string_future = executor.submit(
+                get_db_connection_string, sm_client, f"db_connection_string_{env}"
+            )
+            # Hash password before storing in DB, timing it so the cost factor can be tuned
+            start_time = time.perf_counter()
+            # The '2b' hashes generated by 'bcrypt' are verified by the application through passlib
+            hashed_password = bcrypt.hashpw(
+                password.encode(), bcrypt.gensalt(rounds=bcrypt_rounds, prefix=b"2b")
+            ).decode()
+            elapsed_seconds = time.perf_counter() - start_time
+            logger.info(f"Hashed password in {elapsed_seconds:.3f} seconds")
+            store_password_future.result()
+            db_connection_string = db_connection_string_future.result()
         # Update password in the database
         upsert_user_password(db_connection_string, username, hashed_password, role, disabled)
         logger.info(f"Password rotation completed successfully for {username} in {env}")
@@ -189,14 +261,22 @@ def main() -> int:
     parser.add_argument(
         "--disabled", action="store_true", help="Whether the user account is disabled."
     )
+    parser.add_argument(
+        "--bcrypt_rounds",
+        type=int,
+        default=BCRYPT_ROUNDS,
+        help="The bcrypt cost factor, defaults to the 'BCRYPT_ROUNDS' environment variable or 12",
+    )
     args, _ = parser.parse_known_args()
-    sm_client: SecretsManagerClient = boto3.client("secretsmanager")
+    logger.info(f"Hashing passwords with bcrypt cost {args.bcrypt_rounds}")
+    sm_client: SecretsManagerClient = boto3.client("secretsmanager", config=BOTO_CONFIG)
     manage_passwords(
         env=args.env,
         sm_client=sm_client,
         username=args.username,
         role=args.role,
         disabled=args.disabled,
+        bcrypt_rounds=args.bcrypt_rounds,
     )
 
     return 0
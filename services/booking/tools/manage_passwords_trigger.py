@@ -4,51 +4,37 @@ from argparse import ArgumentParser
 from typing import Sequence
 
 import boto3
+from botocore.config import Config
 from mypy_boto3_ecs import ECSClient
 
-logger = logging.getLogger(name="manage_passwords")
+logger = logging.getLogger(name="manage_passwords_trigger")
 logger.setLevel(logging.INFO)
 handler = logging.StreamHandler(sys.stdout)
 logger.addHandler(handler)
-
-
-def get_latest_task_definition(env: str, ecs_client: ECSClient) -> str:
-    """
-    Retrieve the latest task definition ARN for a given task family.
-
-    Parameters
-    ----------
-    env : str
-        The deployment environment, either 'dev' or 'prod'.
-    ecs_client : ECSClient
-        The ECS client instance.
-
-    Returns
-    -------
-    str
-        The latest task definition ARN.
-    """
-    family = f"booking_service_{env}_ecs_fargate_task_definition"
-    try:
-        response = ecs_client.describe_task_definition(
-            taskDefinition=family,
-        )
-        return response["taskDefinition"]["taskDefinitionArn"]
-    except Exception as error:
-        logger.error(f"Failed to get latest task definition: {error}")
-        raise
+# Fail fast on an unreachable endpoint instead of waiting out botocore's 60 second timeouts, and back off with the
+# client-side rate limiting of the adaptive retry mode when AWS throttles the calls
+BOTO_CONFIG = Config(
+    connect_timeout=3,
+    read_timeout=10,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+)
+# The task definition family of each environment; `run_task` resolves a bare family to its latest ACTIVE revision,
+# the one a `describe_task_definition` lookup of the family would return, without the extra API call
+TASK_DEFINITION_FAMILY = "booking_service_{env}_ecs_fargate_task_definition"
 
 
 def manage_passwords_in_ecs(
     env: str,
     ecs_client: ECSClient,
     cluster_name: str,
-    task_definition_arn: str,
+    task_definition: str,
     subnet_ids: Sequence[str],
     security_group_id: Sequence[str],
     username: str,
     role: str,
     disabled: bool,
+    bcrypt_rounds: int,
 ) -> None:
     """
     Run the password rotation script in a standalone ECS Fargate task.
@@ -61,8 +47,8 @@ def manage_passwords_in_ecs(
         The ECS client.
     cluster_name : str
         The ECS cluster name.
-    task_definition_arn : str
-        The ARN of the ECS task definition.
+    task_definition : str
+        The family, `family:revision`, or ARN of the ECS task definition.
     subnet_ids : Sequence[str]
         The subnet IDs for the ECS task.
     security_group_id : Sequence[str]
@@ -73,6 +59,8 @@ def manage_passwords_in_ecs(
         The role of the user (e.g., 'admin' or 'requester').
     disabled : bool
         Whether the user account is disabled.
+    bcrypt_rounds : int
+        The bcrypt cost factor used to hash the password, passed to the task as `BCRYPT_ROUNDS`.
     """
     # Create the command to run the password rotation script
     command = [
@@ -91,7 +79,7 @@ def manage_passwords_in_ecs(
 
     response = ecs_client.run_task(
         cluster=cluster_name,
-        taskDefinition=task_definition_arn,
+        taskDefinition=task_definition,
         launchType="FARGATE",
         networkConfiguration={
             "awsvpcConfiguration": {
@@ -107,14 +95,18 @@ def manage_passwords_in_ecs(
                     "command": command,
                     "environment": [
                         {"name": "ENV", "value": env},
+                        {"name": "BCRYPT_ROUNDS", "value": str(bcrypt_rounds)},
                     ],
                 },
             ]
         },
     )
 
-    task_arn = response["tasks"][0]["taskArn"]
-    logger.info(f"Running password rotation script in ECS Fargate container: {task_arn}")
+    task = response["tasks"][0]
+    logger.info(
+        f"Running password rotation script in ECS Fargate container: {task['taskArn']} "
+        f"({task['taskDefinitionArn']})"
+    )
 
 
 def main() -> int:
@@ -145,22 +137,27 @@ def main() -> int:
         required=True,
         help="The security group IDs for the ECS task",
     )
+    parser.add_argument(
+        "--bcrypt_rounds",
+        type=int,
+        default=12,
+        help="The bcrypt cost factor used to hash the password, each extra round doubles the hashing time",
+    )
     args, _ = parser.parse_known_args()
 
-    ecs_client: ECSClient = boto3.client("ecs")
-
-    task_definition_arn = get_latest_task_definition(args.env, ecs_client)
+    ecs_client: ECSClient = boto3.client("ecs", config=BOTO_CONFIG)
 
     manage_passwords_in_ecs(
         env=args.env,
         ecs_client=ecs_client,
         cluster_name=args.cluster_name,
-        task_definition_arn=task_definition_arn,
+        task_definition=TASK_DEFINITION_FAMILY.format(env=args.env),
         subnet_ids=args.subnet_ids,
         security_group_id=args.security_group_id,
         username=args.username,
         role=args.role,
         disabled=args.disabled,
+        bcrypt_rounds=args.bcrypt_rounds,
     )
 
     return 0